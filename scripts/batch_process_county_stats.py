@@ -36,6 +36,7 @@ from rich.progress import (
 # Script is in scripts/ directory, need to go up to project root first
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from climate_zarr.climate_config import get_config
 from climate_zarr.county_processor import ModernCountyProcessor
 
 # Strategy selection is now handled internally by processors via create_processing_plan
@@ -44,6 +45,15 @@ from climate_zarr.utils.memory_utils import MemoryMonitor
 
 console = Console()
 
+# Approximate county counts per region, used for strategy selection
+REGION_COUNTY_COUNTS = {
+    "conus": 3109,
+    "alaska": 29,
+    "hawaii": 5,
+    "puerto_rico": 78,
+    "guam": 1,
+}
+
 
 class BatchCountyProcessor:
     """Batch processor for county statistics across multiple Zarr datasets."""
@@ -53,6 +63,7 @@ class BatchCountyProcessor:
         base_dir: Path = None,
         n_workers: int = 4,
         use_chunked_strategy: bool = True,
+        output_format: str = "csv",
     ):
         """Initialize batch processor.
 
@@ -60,12 +71,14 @@ class BatchCountyProcessor:
             base_dir: Base directory containing climate_outputs/
             n_workers: Number of worker processes
             use_chunked_strategy: Whether to use the new optimized chunked strategy
+            output_format: "csv" or "parquet" for the per-dataset statistics
         """
         self.base_dir = base_dir or Path.cwd()
         self.zarr_dir = self.base_dir / "climate_outputs" / "zarr"
         self.shapefile_dir = self.base_dir / "regional_counties"
         self.n_workers = n_workers
         self.use_chunked_strategy = use_chunked_strategy
+        self.output_format = output_format
 
         # Dataset configuration
         self.variables = ["pr", "tas", "tasmax", "tasmin"]
@@ -97,6 +110,12 @@ class BatchCountyProcessor:
         """
         datasets = []
 
+        # Every variable shares the same county shapefile for a region
+        shapefile_paths = {
+            region: self.shapefile_dir / f"{region}_counties.shp"
+            for region in self.regions
+        }
+
         for variable in self.variables:
             for region in self.regions:
                 zarr_path = (
@@ -114,16 +133,13 @@ class BatchCountyProcessor:
                     )
                     size_gb = size_bytes / (1024**3)
 
-                    # Get shapefile path
-                    shapefile_path = self.shapefile_dir / f"{region}_counties.shp"
-
                     datasets.append(
                         {
                             "variable": variable,
                             "region": region,
                             "scenario": self.scenario,
                             "zarr_path": zarr_path,
-                            "shapefile_path": shapefile_path,
+                            "shapefile_path": shapefile_paths[region],
                             "size_gb": size_gb,
                             "size_bytes": size_bytes,
                             "strategy": self._select_strategy(size_gb, region),
@@ -147,14 +163,7 @@ class BatchCountyProcessor:
             return "Vectorized"
 
         # Get county count for this region
-        county_counts = {
-            "conus": 3109,
-            "alaska": 29,
-            "hawaii": 5,
-            "puerto_rico": 78,
-            "guam": 1,
-        }
-        num_counties = county_counts.get(region, 100)
+        num_counties = REGION_COUNTY_COUNTS.get(region, 100)
 
         # Use SpatialChunked strategy for optimal performance when:
         # - Large datasets (>10GB)
@@ -186,12 +195,7 @@ class BatchCountyProcessor:
         Returns:
             Dictionary mapping variable names to threshold values
         """
-        return {
-            "pr": 25.4,  # 25.4mm heavy precipitation threshold
-            "tas": 0.0,  # 0°C freezing point (not used in calculation)
-            "tasmax": 35.0,  # 35°C extreme heat threshold
-            "tasmin": 0.0,  # 0°C freezing threshold (not used in calculation)
-        }
+        return dict(get_config().variable_thresholds)
 
     def process_dataset(self, dataset_info: Dict) -> Tuple[bool, str, Dict]:
         """Process a single dataset.
@@ -281,6 +285,7 @@ class BatchCountyProcessor:
                 )
 
                 # Get memory stats
+                memory_stats = None
                 if self.use_chunked_strategy:
                     memory_stats = self.memory_monitor.get_memory_status()
                     if memory_stats:
@@ -291,6 +296,18 @@ class BatchCountyProcessor:
                 if results_df.empty:
                     return False, "No data processed - empty results", {}
 
+                # Count distinct keys once and reuse them for the saved metadata and stats
+                n_counties = (
+                    int(results_df["county_id"].nunique(dropna=False))
+                    if "county_id" in results_df.columns
+                    else 0
+                )
+                n_years = (
+                    int(results_df["year"].nunique(dropna=False))
+                    if "year" in results_df.columns
+                    else 0
+                )
+
                 # Save results
                 console.print("[yellow]Saving results...[/yellow]")
                 output_path = processor.save_results(
@@ -299,6 +316,12 @@ class BatchCountyProcessor:
                     region=region,
                     scenario=self.scenario,
                     threshold=threshold,
+                    output_format=self.output_format,
+                    data_summary={
+                        "counties_processed": n_counties,
+                        "years_processed": n_years,
+                        "total_records": len(results_df),
+                    },
                 )
 
                 # Calculate processing statistics
@@ -309,11 +332,7 @@ class BatchCountyProcessor:
 
                 # Get memory stats if available
                 peak_memory_actual = memory_used
-                if (
-                    self.use_chunked_strategy
-                    and "memory_stats" in locals()
-                    and memory_stats
-                ):
+                if memory_stats:
                     peak_memory_actual = memory_stats.get("peak_memory_gb", memory_used)
 
                 processing_stats = {
@@ -321,16 +340,12 @@ class BatchCountyProcessor:
                     "memory_used_gb": memory_used,
                     "peak_memory_gb": peak_memory_actual,
                     "records_processed": len(results_df),
-                    "counties_processed": len(results_df["county_id"].unique())
-                    if "county_id" in results_df.columns
-                    else 0,
-                    "years_processed": len(results_df["year"].unique())
-                    if "year" in results_df.columns
-                    else 0,
+                    "counties_processed": n_counties,
+                    "years_processed": n_years,
                     "output_path": str(output_path),
                     "strategy_used": strategy_name,
                     "throughput_counties_per_minute": (
-                        len(results_df["county_id"].unique()) / processing_time * 60
+                        n_counties / processing_time * 60
                     )
                     if processing_time > 0
                     else 0,
@@ -638,6 +653,14 @@ Performance Expectations:
         help="Disable the optimized SpatialChunked strategy, use simple Vectorized instead",
     )
 
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output format for county statistics (default: csv, which "
+        "transform_climate_stats.py reads; parquet is zstd-compressed)",
+    )
+
     parser.add_argument(
         "--memory-target",
         type=float,
@@ -649,7 +672,9 @@ Performance Expectations:
 
     # Initialize batch processor with configuration
     processor = BatchCountyProcessor(
-        n_workers=args.workers, use_chunked_strategy=not args.no_chunking
+        n_workers=args.workers,
+        use_chunked_strategy=not args.no_chunking,
+        output_format=args.format,
     )
 
     # Update memory target if specified
@@ -666,7 +691,8 @@ Performance Expectations:
             f"[bold cyan]Batch Processing Configuration[/bold cyan]\n"
             f"Workers: {args.workers}\n"
             f"Strategy: {'SpatialChunked (optimized)' if not args.no_chunking else 'Vectorized (simple)'}\n"
-            f"Memory Target: {processor.target_memory_usage * 100:.0f}%",
+            f"Memory Target: {processor.target_memory_usage * 100:.0f}%\n"
+            f"Output Format: {args.format}",
             title="⚙️ Settings",
         )
     )
@@ -13,11 +13,17 @@ def get_file_count_and_size(directory):
     if not os.path.exists(directory):
         return 0, "N/A", None, None
 
-    nc_files = sorted(Path(directory).glob("*.nc"))
-    if not nc_files:
+    # Only names are needed; scandir entries avoid a Path and stat per file
+    with os.scandir(directory) as entries:
+        nc_names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".nc") and entry.is_file(follow_symlinks=False)
+        )
+    if not nc_names:
         return 0, "N/A", None, None
 
-    count = len(nc_files)
+    count = len(nc_names)
 
     # Get total size
     result = subprocess.run(["du", "-sh", directory], capture_output=True, text=True)
@@ -25,8 +31,8 @@ def get_file_count_and_size(directory):
 
     # Extract years from filenames
     years = []
-    for f in nc_files:
-        year_str = "".join(filter(str.isdigit, f.stem[-4:]))
+    for name in nc_names:
+        year_str = "".join(filter(str.isdigit, name[: -len(".nc")][-4:]))
         if year_str and len(year_str) == 4:
             years.append(int(year_str))
 
@@ -16,7 +16,6 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.text import Text
 
 console = Console()
@@ -52,8 +51,10 @@ def check_stats_exists(variable: str, region: str, scenario: str) -> bool:
         / scenario
         / f"{region}_{scenario}_{variable}_stats_threshold*.csv"
     )
-    # Use glob to find any matching file
-    return len(list(stats_path.parent.glob(stats_path.name))) > 0 if stats_path.parent.exists() else False
+    # Stop at the first matching file instead of listing them all
+    if not stats_path.parent.exists():
+        return False
+    return next(stats_path.parent.glob(stats_path.name), None) is not None
 
 
 def get_zarr_size(variable: str, region: str, scenario: str) -> str:
@@ -114,6 +115,23 @@ def get_completion_stats() -> Dict[str, Dict[str, int]]:
     return stats
 
 
+def progress_cells(complete: int, total: int, percent: float) -> Tuple[str, str]:
+    """Build the styled count and bar cells for one progress column pair."""
+    if percent == 100:
+        color = "green"
+    elif percent > 0:
+        color = "yellow"
+    else:
+        color = "red"
+
+    filled = int(percent / 5)
+    bar = "█" * filled + "░" * (20 - filled)
+    return (
+        f"[{color}]{complete}/{total}[/{color}]",
+        f"[{color}]{bar}[/{color}]",
+    )
+
+
 def create_overview_table() -> Table:
     """Create overview table of all scenarios."""
     stats = get_completion_stats()
@@ -128,41 +146,10 @@ def create_overview_table() -> Table:
     for scenario in SCENARIOS:
         data = stats[scenario]
 
-        # Zarr progress bar
-        zarr_complete = data["zarr_complete"]
-        zarr_total = data["total"]
-        zarr_pct = data["zarr_percent"]
-
-        zarr_status = f"{zarr_complete}/{zarr_total}"
-        zarr_bar = "█" * int(zarr_pct / 5) + "░" * (20 - int(zarr_pct / 5))
-
-        if zarr_pct == 100:
-            zarr_color = "green"
-        elif zarr_pct > 0:
-            zarr_color = "yellow"
-        else:
-            zarr_color = "red"
-
-        # Stats progress bar
-        stats_complete = data["stats_complete"]
-        stats_pct = data["stats_percent"]
-
-        stats_status = f"{stats_complete}/{zarr_total}"
-        stats_bar = "█" * int(stats_pct / 5) + "░" * (20 - int(stats_pct / 5))
-
-        if stats_pct == 100:
-            stats_color = "green"
-        elif stats_pct > 0:
-            stats_color = "yellow"
-        else:
-            stats_color = "red"
-
         table.add_row(
             scenario.upper(),
-            f"[{zarr_color}]{zarr_status}[/{zarr_color}]",
-            f"[{zarr_color}]{zarr_bar}[/{zarr_color}]",
-            f"[{stats_color}]{stats_status}[/{stats_color}]",
-            f"[{stats_color}]{stats_bar}[/{stats_color}]",
+            *progress_cells(data["zarr_complete"], data["total"], data["zarr_percent"]),
+            *progress_cells(data["stats_complete"], data["total"], data["stats_percent"]),
         )
 
     return table
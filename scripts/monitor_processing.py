@@ -9,6 +9,7 @@ This script monitors:
 - Processing speed estimates
 """
 
+import os
 import time
 import psutil
 from pathlib import Path
@@ -48,18 +49,22 @@ def get_processing_stats(stats_dir: Path):
                     continue
 
                 scenario = scenario_dir.name
-                csv_files = list(scenario_dir.glob("*.csv"))
-
-                if csv_files:
-                    file_count = len(csv_files)
-                    file_sizes = sum(f.stat().st_size for f in csv_files)
+                # One directory listing and one stat per CSV
+                with os.scandir(scenario_dir) as entries:
+                    csv_stats = [
+                        entry.stat() for entry in entries if entry.name.endswith(".csv")
+                    ]
+
+                if csv_stats:
+                    file_count = len(csv_stats)
+                    file_sizes = sum(st.st_size for st in csv_stats)
                     total_files += file_count
                     total_size += file_sizes
 
                     stats[variable][region][scenario] = {
                         "files": file_count,
                         "size_bytes": file_sizes,
-                        "last_modified": max(f.stat().st_mtime for f in csv_files),
+                        "last_modified": max(st.st_mtime for st in csv_stats),
                     }
 
     return {
@@ -16,9 +16,13 @@ Author: Climate Zarr Toolkit
 Date: 2025-08-22
 """
 
+import fnmatch
+import os
+import re
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Union
 import warnings
@@ -31,6 +35,14 @@ from rich.panel import Panel
 from rich.table import Table
 import yaml
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Configure warnings
 warnings.filterwarnings("ignore", category=pd.errors.PerformanceWarning)
 
@@ -46,6 +58,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def write_csv(df: pd.DataFrame, output_path: Path) -> None:
+    """
+    Write a DataFrame to CSV, preferring PyArrow's multithreaded writer.
+
+    Falls back to ``DataFrame.to_csv`` when PyArrow is not installed.
+    """
+    if HAS_PYARROW:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(
+            table,
+            str(output_path),
+            write_options=pacsv.WriteOptions(include_header=True),
+        )
+    else:
+        df.to_csv(output_path, index=False)
+
+
+def write_parquet(df: pd.DataFrame, output_path: Path) -> None:
+    """Write a DataFrame to Snappy-compressed Parquet via PyArrow."""
+    df.to_parquet(output_path, engine="pyarrow", compression="snappy", index=False)
+
+
+def write_partitioned_parquet(
+    df: pd.DataFrame, output_path: Path, partition_on: List[str]
+) -> None:
+    """
+    Write a DataFrame as a Dask Parquet dataset partitioned on columns.
+
+    All partitions are written in one parallel pass, one directory per
+    partition value (e.g. ``region=conus/``).
+    """
+    import dask.dataframe as dd
+
+    ddf = dd.from_pandas(df, npartitions=os.cpu_count() or 1)
+    ddf.to_parquet(
+        str(output_path),
+        partition_on=partition_on,
+        engine="pyarrow",
+        compression="snappy",
+        write_index=False,
+    )
+
+
 class ClimateDataTransformer:
     """
     Transforms county-level climate statistics into standardized format.
@@ -76,6 +131,14 @@ class ClimateDataTransformer:
         # Load output format specification
         self.target_format = self._load_format_spec()
 
+        # Target columns in output order, fixed for the transformer's lifetime
+        self._target_col_names = tuple(
+            col["name"] for col in self.target_format["columns"]
+        )
+        self._col_type_pairs = tuple(
+            (col["name"], col["type"]) for col in self.target_format["columns"]
+        )
+
         # Climate variable mappings
         self.variable_mappings = {
             "pr": {
@@ -108,6 +171,9 @@ class ClimateDataTransformer:
             },
         }
 
+        # Identifier columns carried through every variable
+        self.id_columns = ["county_id", "year", "county_name", "state", "scenario"]
+
         # Regions to process
         self.regions = ["conus", "alaska", "hawaii", "puerto_rico", "guam"]
 
@@ -153,12 +219,20 @@ class ClimateDataTransformer:
             "\n[bold blue]Discovering climate statistics files...[/bold blue]"
         )
 
+        # Walk all subdirectories once and bucket each CSV name by variable
+        # pattern, rather than re-walking the tree per variable
+        matchers = [
+            (variable, re.compile(fnmatch.translate(mapping["source_pattern"])).match)
+            for variable, mapping in self.variable_mappings.items()
+        ]
+        for file in self.stats_dir.rglob("*.csv"):
+            for variable, match in matchers:
+                if match(file.name):
+                    discovered_files[variable].append(file)
+
         for variable in self.variable_mappings.keys():
             pattern = self.variable_mappings[variable]["source_pattern"]
-
-            # Search in all subdirectories
-            files = list(self.stats_dir.rglob(pattern))
-            discovered_files[variable] = files
+            files = discovered_files[variable]
 
             if files:
                 console.print(f"  ✓ Found {len(files)} {variable.upper()} files")
@@ -205,10 +279,13 @@ class ClimateDataTransformer:
                     )
                     continue
 
+                # Project to the needed columns while parsing
+                needed = self._required_columns(variable)
+
                 dfs = []
                 for file_path in file_list:
                     try:
-                        df = pd.read_csv(file_path)
+                        df = pd.read_csv(file_path, usecols=lambda c: c in needed)
 
                         # Add metadata columns
                         df["source_file"] = file_path.name
@@ -224,8 +301,12 @@ class ClimateDataTransformer:
                         continue
 
                 if dfs:
-                    # Concatenate all files for this variable
-                    climate_data[variable] = pd.concat(dfs, ignore_index=True)
+                    # Concatenate all files for this variable; the per-file frames
+                    # are never reused, so skip the defensive copy and column sort
+                    climate_data[variable] = pd.concat(
+                        dfs, ignore_index=True, copy=False, sort=False
+                    )
+                    del dfs
                     console.print(
                         f"  ✓ Loaded {len(climate_data[variable])} records for {variable.upper()}"
                     )
@@ -243,6 +324,17 @@ class ClimateDataTransformer:
 
         return climate_data
 
+    def _required_columns(self, variable: str) -> set:
+        """Source columns needed downstream for a variable's files."""
+        mapping = self.variable_mappings[variable]
+        needed = set(self.id_columns)
+        needed.update(mapping["key_columns"])
+        needed.update(mapping["target_mappings"].keys())
+        if variable == "tasmax":
+            # Inputs to _calculate_daysabove90F
+            needed.update({"threshold_temp_c", "days_above_35c"})
+        return needed
+
     def _extract_region_from_path(self, file_path: Path) -> str:
         """Extract region name from file path."""
         path_parts = file_path.parts
@@ -264,37 +356,39 @@ class ClimateDataTransformer:
         # For now, we'll use the existing days_above_35c column as it's the closest
         # In a production system, you'd want to reprocess with the correct threshold
 
-        if "days_above_35c" in tasmax_data.columns:
+        # Column selection is decided once from the schema; the values are
+        # pulled as plain ndarrays so no intermediate boolean Series is built
+        columns = set(tasmax_data.columns)
+
+        if "days_above_35c" in columns:
             # Use the existing 35°C threshold as a conservative estimate
-            tasmax_data["daysabove90F"] = tasmax_data["days_above_35c"]
+            source_arr = tasmax_data["days_above_35c"].to_numpy()
             logger.warning(
                 "Using days_above_35c as proxy for days_above_90F (32.2°C). "
                 "For precise results, reprocess with 32.2°C threshold."
             )
-        elif "days_above_threshold_c" in tasmax_data.columns:
+        elif "days_above_threshold_c" in columns:
+            source_arr = tasmax_data["days_above_threshold_c"].to_numpy()
+
             # Check if the threshold is 32.2°C
-            if "threshold_temp_c" in tasmax_data.columns:
-                # Check if any records have 32.2°C threshold
-                correct_threshold = tasmax_data["threshold_temp_c"] == 32.2
-                if correct_threshold.any():
-                    tasmax_data["daysabove90F"] = tasmax_data["days_above_threshold_c"]
-                else:
+            if "threshold_temp_c" in columns:
+                thr_arr = tasmax_data["threshold_temp_c"].to_numpy()
+                if not np.any(thr_arr == 32.2):
                     # Use the existing threshold as proxy
-                    tasmax_data["daysabove90F"] = tasmax_data["days_above_threshold_c"]
                     logger.warning(
                         f"No 32.2°C threshold found. Using existing threshold "
-                        f"({tasmax_data['threshold_temp_c'].iloc[0]}°C) as proxy."
+                        f"({thr_arr[0] if len(thr_arr) else 'unknown'}°C) as proxy."
                     )
-            else:
-                tasmax_data["daysabove90F"] = tasmax_data["days_above_threshold_c"]
         else:
             # No threshold data available, set to NaN
-            tasmax_data["daysabove90F"] = np.nan
+            source_arr = np.nan
             logger.warning(
                 "No threshold temperature data found in tasmax files. "
                 "Setting daysabove90F to NaN."
             )
 
+        tasmax_data["daysabove90F"] = source_arr
+
         return tasmax_data
 
     def transform_data(self, climate_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -327,12 +421,11 @@ class ClimateDataTransformer:
 
                 # Clean and prepare the data
                 var_data = df.copy()
+                cols = set(var_data.columns)
 
                 # Create a unique key for each record (including scenario)
                 scenario_col = (
-                    var_data["scenario"]
-                    if "scenario" in var_data.columns
-                    else "unknown"
+                    var_data["scenario"] if "scenario" in cols else "unknown"
                 )
                 var_data["merge_key"] = (
                     var_data["county_id"].astype(str)
@@ -357,6 +450,7 @@ class ClimateDataTransformer:
                 # Special handling for tasmax to calculate daysabove90F
                 if variable == "tasmax":
                     var_data = self._calculate_daysabove90F(var_data)
+                    cols = set(var_data.columns)
 
                 # Create the target columns for this variable (including scenario)
                 base_columns = [
@@ -367,19 +461,19 @@ class ClimateDataTransformer:
                     "state",
                     "region",
                 ]
-                if "scenario" in var_data.columns:
+                if "scenario" in cols:
                     base_columns.insert(3, "scenario")  # Insert scenario after year
                 target_data = var_data[base_columns].copy()
 
                 # Add variable-specific columns based on mappings
                 mappings = self.variable_mappings[variable]["target_mappings"]
                 for source_col, target_col in mappings.items():
-                    if source_col in var_data.columns:
+                    if source_col in cols:
                         target_data[target_col] = var_data[source_col]
                         logger.debug(f"    Mapped {source_col} -> {target_col}")
 
                 # For tasmax, also add the calculated daysabove90F
-                if variable == "tasmax" and "daysabove90F" in var_data.columns:
+                if variable == "tasmax" and "daysabove90F" in cols:
                     target_data["daysabove90F"] = var_data["daysabove90F"]
 
                 processed_variables[variable] = target_data
@@ -446,8 +540,10 @@ class ClimateDataTransformer:
             result_df["county_id"], errors="coerce"
         ).astype("Int64")
 
+        cols = set(result_df.columns)
+
         # 2. Format county name as "COUNTY, STATE"
-        if "county_name" in result_df.columns and "state" in result_df.columns:
+        if "county_name" in cols and "state" in cols:
             # Handle missing state information
             state_col = result_df["state"].fillna("")
             county_col = result_df["county_name"].fillna("")
@@ -462,15 +558,11 @@ class ClimateDataTransformer:
                 "County name or state column missing. Using county_id as name."
             )
             result_df["name"] = result_df["county_id"].astype(str)
+        cols.add("name")
 
         # 3. Ensure required columns exist with appropriate defaults
-        [col["name"] for col in self.target_format["columns"]]
-
-        for col_spec in self.target_format["columns"]:
-            col_name = col_spec["name"]
-            col_type = col_spec["type"]
-
-            if col_name not in result_df.columns:
+        for col_name, col_type in self._col_type_pairs:
+            if col_name not in cols:
                 # Create missing columns with appropriate defaults
                 if col_type == "integer":
                     result_df[col_name] = pd.NA
@@ -479,35 +571,37 @@ class ClimateDataTransformer:
                 else:  # string
                     result_df[col_name] = ""
 
+                cols.add(col_name)
                 logger.warning(
                     f"Column '{col_name}' not found in data. Created with default values."
                 )
 
         # 4. Select and order columns according to target format (keep region for later)
-        final_columns = [col["name"] for col in self.target_format["columns"]]
-        available_columns = [col for col in final_columns if col in result_df.columns]
+        available_columns = [col for col in self._target_col_names if col in cols]
 
         # Keep region column if it exists for potential separation later
-        if "region" in result_df.columns and "region" not in available_columns:
+        if "region" in cols and "region" not in available_columns:
             available_columns.append("region")
 
         result_df = result_df[available_columns]
+        cols = set(available_columns)
 
         # 5. Apply data type conversions
-        for col_spec in self.target_format["columns"]:
-            col_name = col_spec["name"]
-            col_type = col_spec["type"]
-
-            if col_name in result_df.columns:
+        for col_name, col_type in self._col_type_pairs:
+            if col_name in cols:
                 try:
+                    # Columns parsed as numbers skip the to_numeric coercion pass
+                    column = result_df[col_name]
                     if col_type == "integer":
-                        result_df[col_name] = pd.to_numeric(
-                            result_df[col_name], errors="coerce"
-                        ).astype("Int64")
+                        if column.dtype != "Int64":
+                            if not pd.api.types.is_numeric_dtype(column):
+                                column = pd.to_numeric(column, errors="coerce")
+                            result_df[col_name] = column.astype("Int64")
                     elif col_type == "numeric":
-                        result_df[col_name] = pd.to_numeric(
-                            result_df[col_name], errors="coerce"
-                        )
+                        if not pd.api.types.is_numeric_dtype(column):
+                            result_df[col_name] = pd.to_numeric(
+                                column, errors="coerce"
+                            )
                     else:  # string
                         result_df[col_name] = result_df[col_name].astype(str)
                 except Exception as e:
@@ -517,17 +611,23 @@ class ClimateDataTransformer:
 
         return result_df
 
-    def validate_output(self, df: pd.DataFrame) -> Dict[str, Union[int, float, List]]:
+    def validate_output(
+        self, df: pd.DataFrame, display: bool = True
+    ) -> Dict[str, Union[int, float, List]]:
         """
         Validate the transformed output and generate statistics.
 
         Args:
             df: Transformed DataFrame
+            display: If True, print the validation summary tables
 
         Returns:
             Dictionary with validation results and statistics
         """
-        console.print("\n[bold blue]Validating output data...[/bold blue]")
+        if display:
+            console.print("\n[bold blue]Validating output data...[/bold blue]")
+
+        cols = set(df.columns)
 
         validation_results = {
             "total_records": len(df),
@@ -536,7 +636,7 @@ class ClimateDataTransformer:
             if len(df) > 0
             else [None, None],
             "scenarios": df["scenario"].unique().tolist()
-            if "scenario" in df.columns
+            if "scenario" in cols
             else [],
             "missing_data": {},
             "data_quality_issues": [],
@@ -558,12 +658,21 @@ class ClimateDataTransformer:
 
         # Check for duplicate records (including scenario if present)
         dup_cols = ["cid2", "year"]
-        if "scenario" in df.columns:
+        if "scenario" in cols:
             dup_cols.append("scenario")
 
-        duplicate_mask = df.duplicated(subset=dup_cols)
-        if duplicate_mask.any():
-            dup_count = duplicate_mask.sum()
+        # One hashed pass gives per-key counts, reused for the top collisions
+        key_counts = df.groupby(dup_cols, observed=True, sort=False, dropna=False).size()
+        colliding = key_counts[key_counts > 1]
+        dup_count = int((colliding - 1).sum())
+        validation_results["duplicate_keys"] = [
+            {
+                "key": [str(k) for k in (key if isinstance(key, tuple) else (key,))],
+                "count": int(count),
+            }
+            for key, count in colliding.nlargest(5).items()
+        ]
+        if dup_count:
             validation_results["data_quality_issues"].append(
                 f"{dup_count} duplicate county-year-scenario combinations found"
             )
@@ -576,6 +685,13 @@ class ClimateDataTransformer:
                 f"{invalid_count} invalid FIPS codes found"
             )
 
+        if display:
+            self.display_validation(validation_results)
+
+        return validation_results
+
+    def display_validation(self, validation_results: Dict) -> None:
+        """Print validation summary, missing data and quality issue tables."""
         # Display validation summary
         table = Table(title="Data Validation Summary")
         table.add_column("Metric", style="cyan")
@@ -617,13 +733,12 @@ class ClimateDataTransformer:
                 "\n[bold green]✓ No major data quality issues found[/bold green]"
             )
 
-        return validation_results
-
     def save_results(
         self,
         df: pd.DataFrame,
         validation_results: Dict,
         output_filename: str = "transformed_climate_stats.csv",
+        partition_by_region: bool = False,
     ) -> Path:
         """
         Save transformed data and metadata.
@@ -631,7 +746,10 @@ class ClimateDataTransformer:
         Args:
             df: Transformed DataFrame
             validation_results: Validation results dictionary
-            output_filename: Name for the output CSV file
+            output_filename: Name for the output file; a ``.parquet`` suffix
+                writes Parquet, anything else writes CSV
+            partition_by_region: If True, write a Parquet dataset directory
+                partitioned on the ``region`` column using Dask
 
         Returns:
             Path to the saved file
@@ -641,7 +759,13 @@ class ClimateDataTransformer:
 
         # Save main CSV file
         output_path = self.output_dir / output_filename
-        df.to_csv(output_path, index=False)
+        if partition_by_region:
+            output_path = output_path.with_suffix("")
+            write_partitioned_parquet(df, output_path, partition_on=["region"])
+        elif output_path.suffix == ".parquet":
+            write_parquet(df, output_path)
+        else:
+            write_csv(df, output_path)
         logger.info(f"Saved transformed data to {output_path}")
 
         # Save metadata
@@ -655,20 +779,33 @@ class ClimateDataTransformer:
             "regions_processed": self.regions,
         }
 
-        metadata_path = (
-            self.output_dir / f"{output_filename.replace('.csv', '_metadata.json')}"
-        )
-        import json
+        output_stem = output_path.stem
+        metadata_path = self.output_dir / f"{output_stem}_metadata.json"
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            # Native encoder for numpy scalars; str() only for leftovers like Path
+            metadata_path.write_bytes(
+                orjson.dumps(
+                    metadata,
+                    default=str,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            import json
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f, indent=2, default=str)
         logger.info(f"Saved metadata to {metadata_path}")
 
         # Save validation report
-        report_path = (
-            self.output_dir
-            / f"{output_filename.replace('.csv', '_validation_report.txt')}"
-        )
+        report_path = self.output_dir / f"{output_stem}_validation_report.txt"
         with open(report_path, "w") as f:
             f.write("Climate Data Transformation Validation Report\n")
             f.write("=" * 50 + "\n\n")
@@ -691,6 +828,11 @@ class ClimateDataTransformer:
                 f.write("\nData Quality Issues:\n")
                 for issue in validation_results["data_quality_issues"]:
                     f.write(f"  • {issue}\n")
+
+                if validation_results.get("duplicate_keys"):
+                    f.write("\nMost Duplicated Keys:\n")
+                    for entry in validation_results["duplicate_keys"]:
+                        f.write(f"  {' / '.join(entry['key'])}: {entry['count']:,}\n")
             else:
                 f.write("\nNo major data quality issues found.\n")
 
@@ -702,6 +844,7 @@ class ClimateDataTransformer:
         self,
         output_filename: str = "transformed_climate_stats.csv",
         separate_by_region: bool = False,
+        use_dask: bool = False,
     ) -> Union[Path, List[Path]]:
         """
         Run the complete transformation pipeline.
@@ -709,6 +852,8 @@ class ClimateDataTransformer:
         Args:
             output_filename: Name for the output file(s)
             separate_by_region: If True, create separate files per region
+            use_dask: If True, write one Parquet dataset partitioned by
+                region with Dask instead of per-region files
 
         Returns:
             Path(s) to output file(s)
@@ -752,48 +897,75 @@ class ClimateDataTransformer:
             # Step 4: Validate results
             validation_results = self.validate_output(transformed_data)
 
-            # Step 5: Save results
-            if separate_by_region:
-                output_paths = []
+            # Step 5: Save results (region is only used to split the output)
+            if use_dask and "region" in transformed_data.columns:
+                output_path = self.save_results(
+                    transformed_data,
+                    validation_results,
+                    output_filename,
+                    partition_by_region=True,
+                )
+                console.print("\n[bold green]✅ Transformation complete![/bold green]")
+                console.print(f"Partitioned dataset saved to: {output_path}")
+                return output_path
+
+            output_columns = [
+                col for col in transformed_data.columns if col != "region"
+            ]
 
+            if separate_by_region:
                 # Check if region column exists
                 if "region" not in transformed_data.columns:
                     console.print(
                         "[bold red]❌ Region column not found. Cannot separate by region.[/bold red]"
                     )
                     console.print("Saving as single file instead...")
-                    final_data = transformed_data.copy()
                     output_path = self.save_results(
-                        final_data, validation_results, output_filename
+                        transformed_data, validation_results, output_filename
                     )
                     return output_path
 
-                for region in transformed_data["region"].unique():
-                    if pd.isna(region):
-                        continue
-
-                    region_data = transformed_data[
-                        transformed_data["region"] == region
-                    ].copy()
+                # Partition once by region (NaN regions are dropped by groupby)
+                region_jobs = [
                     # Remove region column from output
-                    region_data = region_data.drop(columns=["region"], errors="ignore")
-
-                    region_filename = f"{region}_{output_filename}"
-                    region_validation = self.validate_output(region_data)
+                    (region, region_data[output_columns])
+                    for region, region_data in transformed_data.groupby(
+                        "region", sort=False, observed=True
+                    )
+                ]
 
+                def _validate_and_save(job):
+                    region, region_data = job
+                    region_validation = self.validate_output(region_data, display=False)
                     output_path = self.save_results(
-                        region_data, region_validation, region_filename
+                        region_data, region_validation, f"{region}_{output_filename}"
                     )
-                    output_paths.append(output_path)
+                    return output_path, region_validation
+
+                # Regions are independent, so validate and write them concurrently;
+                # summaries are printed afterwards to keep console output ordered
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(8, len(region_jobs)))
+                ) as executor:
+                    region_results = list(executor.map(_validate_and_save, region_jobs))
 
+                output_paths = []
+                for (region, region_data), (output_path, region_validation) in zip(
+                    region_jobs, region_results
+                ):
+                    console.print(
+                        f"\n[bold blue]Validating {region} output data...[/bold blue]"
+                    )
+                    self.display_validation(region_validation)
                     console.print(
                         f"  ✓ Saved {region} data: {len(region_data)} records"
                     )
+                    output_paths.append(output_path)
 
                 return output_paths
             else:
                 # Remove region column from final output if not needed
-                final_data = transformed_data.drop(columns=["region"], errors="ignore")
+                final_data = transformed_data[output_columns]
                 output_path = self.save_results(
                     final_data, validation_results, output_filename
                 )
@@ -824,9 +996,15 @@ Examples:
   
   # Separate files by region
   python transform_climate_stats.py --separate-by-region
+
+  # One Parquet dataset partitioned by region (Dask)
+  python transform_climate_stats.py --dask
   
   # Custom output filename
-  python transform_climate_stats.py --output climate_data_2025.csv
+  python transform_climate_stats.py --output climate_data_2025.parquet
+
+  # Write CSV instead of Parquet
+  python transform_climate_stats.py --format csv
         """,
     )
 
@@ -850,8 +1028,16 @@ Examples:
 
     parser.add_argument(
         "--output",
-        default="transformed_climate_stats.csv",
-        help="Output filename (default: transformed_climate_stats.csv)",
+        default=None,
+        help="Output filename (default: transformed_climate_stats.<format>)",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="parquet" if HAS_PYARROW else "csv",
+        help="Output file format when --output is not given "
+        "(default: parquet, or csv if PyArrow is not installed)",
     )
 
     parser.add_argument(
@@ -860,6 +1046,12 @@ Examples:
         help="Create separate output files for each region",
     )
 
+    parser.add_argument(
+        "--dask",
+        action="store_true",
+        help="Write a single Parquet dataset partitioned by region using Dask",
+    )
+
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -867,6 +1059,8 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    output_filename = args.output or f"transformed_climate_stats.{args.format}"
+
     # Initialize transformer
     transformer = ClimateDataTransformer(
         stats_dir=args.stats_dir,
@@ -877,7 +1071,9 @@ Examples:
     # Run transformation
     try:
         output_paths = transformer.run_transformation(
-            output_filename=args.output, separate_by_region=args.separate_by_region
+            output_filename=output_filename,
+            separate_by_region=args.separate_by_region,
+            use_dask=args.dask,
         )
 
         if output_paths:
@@ -6,33 +6,148 @@ Creates a map showing which US counties have climate data (green)
 and which are missing (red) from the processed dataset.
 """
 
+import os
+import sys
+import warnings
+from pathlib import Path
+
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import warnings
+import matplotlib
+
+# Without a display server, use the non-interactive backend up front so pyplot
+# never initializes a GUI toolkit (an explicit MPLBACKEND still wins)
+HEADLESS = sys.platform.startswith("linux") and not (
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+)
+if HEADLESS and "MPLBACKEND" not in os.environ:
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.colors import ListedColormap  # noqa: E402
 
 warnings.filterwarnings("ignore")
 
+# State FIPS codes excluded from the CONUS map: AK, HI, PR, VI, GU, MP, AS
+NON_CONUS_FIPS = np.array([2, 15, 72, 78, 66, 69, 60], dtype=np.int16)
+
+# Display names for the states most often missing from the stats
+STATE_NAMES = {
+    "36": "New York",
+    "27": "Minnesota",
+    "42": "Pennsylvania",
+    "53": "Washington",
+    "55": "Wisconsin",
+    "51": "Virginia",
+    "26": "Michigan",
+    "41": "Oregon",
+    "06": "California",
+    "16": "Idaho",
+    "72": "Puerto Rico",
+}
+
+COUNTY_SHAPEFILE = Path("tl_2024_us_county/tl_2024_us_county.shp")
+COUNTY_CACHE = Path("tl_2024_us_county/counties.parquet")
+
+# Transformed stats written by transform_climate_stats.py (Parquet preferred)
+TRANSFORMED_PARQUET = Path("climate_outputs/transformed/transformed_climate_stats.parquet")
+TRANSFORMED_CSV = Path("climate_outputs/transformed/transformed_climate_stats.csv")
+
+# Coverage status categories, in colormap order
+STATUS_CATEGORIES = ["Missing Data", "Has Climate Data"]
+COVERAGE_CMAP = ListedColormap(["salmon", "lightgreen"])
+
+# Simplification tolerances (degrees); finer for the small inset maps
+CONUS_TOLERANCE = 0.01
+INSET_TOLERANCE = 0.005
+
+
+def load_counties():
+    """Load county geometries, caching the shapefile as GeoParquet.
+
+    Geometries are simplified to the inset tolerance before caching, since
+    full-resolution TIGER outlines are never resolved at the plotted scale.
+    The cache is rebuilt whenever the shapefile is newer than it.
+    """
+    columns = ["GEOID", "STATEFP", "geometry"]
+
+    if (
+        COUNTY_CACHE.exists()
+        and COUNTY_CACHE.stat().st_mtime >= COUNTY_SHAPEFILE.stat().st_mtime
+    ):
+        return gpd.read_parquet(COUNTY_CACHE, columns=columns)
+
+    counties = gpd.read_file(COUNTY_SHAPEFILE, columns=columns[:-1])
+    counties["geometry"] = counties.geometry.simplify(
+        tolerance=INSET_TOLERANCE, preserve_topology=True
+    )
+    try:
+        counties.to_parquet(COUNTY_CACHE)
+    except ImportError:
+        # GeoParquet needs pyarrow; without it just skip the cache
+        pass
+    return counties
+
+
+def count_by_state(counties_shp):
+    """Count processed and total counties per state in one bincount pass."""
+    state_codes = counties_shp["_STATEFP_i"].to_numpy()
+    has = counties_shp["has_data"].to_numpy(dtype=np.int32)
+
+    total = np.bincount(state_codes)
+    processed = np.bincount(state_codes, weights=has).astype(np.int64)
+    present = np.flatnonzero(total)
+
+    counts = pd.DataFrame(
+        {"processed": processed[present], "total": total[present]},
+        index=pd.Index([f"{code:02d}" for code in present], name="STATEFP"),
+    )
+    counts["missing"] = counts["total"] - counts["processed"]
+    return counts
+
+
+def create_missing_counties_map(fig=None):
+    """Create visualization of missing counties.
 
-def create_missing_counties_map():
-    """Create visualization of missing counties."""
+    Pass an existing ``fig`` to redraw into it (it is cleared first) when
+    rendering repeatedly, instead of allocating a new canvas per call.
+    """
 
     print("Loading data...")
 
     # Load the full US county shapefile
-    counties_shp = gpd.read_file("tl_2024_us_county/tl_2024_us_county.shp")
-    counties_shp["GEOID_int"] = counties_shp["GEOID"].astype(int)
+    counties_shp = load_counties()
+    counties_shp["GEOID_int"] = pd.to_numeric(counties_shp["GEOID"], downcast="unsigned")
+
+    # Store STATEFP as a categorical and parse only its ~56 distinct codes,
+    # then broadcast them through the category codes for every regional subset
+    counties_shp["STATEFP"] = counties_shp["STATEFP"].astype("category")
+    statefp = counties_shp["STATEFP"].cat
+    state_codes = statefp.categories.to_numpy(dtype="U2").astype(np.int16)[
+        statefp.codes.to_numpy()
+    ]
+    counties_shp["_STATEFP_i"] = state_codes
 
     # Load processed counties from transformed data
-    processed_df = pd.read_csv(
-        "climate_outputs/transformed/transformed_climate_stats.csv"
-    )
-    processed_counties = set(processed_df["cid2"].unique())
+    if TRANSFORMED_PARQUET.exists():
+        processed_df = pd.read_parquet(TRANSFORMED_PARQUET, columns=["cid2"])
+    else:
+        processed_df = pd.read_csv(
+            TRANSFORMED_CSV, usecols=["cid2"], dtype={"cid2": "Int64"}
+        )
+    processed_ids = np.unique(processed_df["cid2"].dropna().to_numpy(dtype=np.int64))
+    processed_idx = pd.Index(processed_ids)
 
-    # Mark counties as processed or missing
-    counties_shp["has_data"] = counties_shp["GEOID_int"].isin(processed_counties)
-    counties_shp["status"] = counties_shp["has_data"].map(
-        {True: "Has Climate Data", False: "Missing Data"}
+    # Mark counties as processed or missing (hash lookup on int64, no boxing)
+    counties_shp["has_data"] = (
+        processed_idx.get_indexer(counties_shp["GEOID_int"].to_numpy(dtype=np.int64))
+        != -1
+    )
+    # Fixed categories keep the colors stable when a subset has only one status
+    counties_shp["status"] = pd.Categorical(
+        np.where(counties_shp["has_data"], STATUS_CATEGORIES[1], STATUS_CATEGORIES[0]),
+        categories=STATUS_CATEGORIES,
     )
 
     # Calculate statistics
@@ -49,32 +164,33 @@ def create_missing_counties_map():
         f"Missing: {missing_counties} ({missing_counties / total_counties * 100:.1f}%)"
     )
 
-    # Create figure with subplots for different regions
-    fig = plt.figure(figsize=(20, 12))
+    # Create figure with subplots for different regions, reusing the caller's
+    # canvas when one is supplied
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(20, 12))
+    else:
+        fig.clear()
 
     # Main map - Continental US
-    ax_main = plt.subplot(2, 3, (1, 4))
+    ax_main = fig.add_subplot(2, 3, (1, 4))
 
     # Filter for continental US (exclude Alaska, Hawaii, territories)
-    conus = counties_shp[counties_shp["STATEFP"].astype(int) < 60]
-    conus = conus[
-        ~conus["STATEFP"].isin(["02", "15", "72", "78", "66", "69", "60"])
-    ]  # Exclude AK, HI, PR, VI, GU, MP, AS
+    conus = counties_shp.loc[~np.isin(state_codes, NON_CONUS_FIPS)].copy()
+    conus["geometry"] = conus.geometry.simplify(
+        tolerance=CONUS_TOLERANCE, preserve_topology=True
+    )
 
     # Plot CONUS
-    conus[conus["has_data"]].plot(
-        ax=ax_main,
-        color="lightgreen",
-        edgecolor="gray",
-        linewidth=0.1,
-        label="Has Climate Data",
-    )
-    conus[~conus["has_data"]].plot(
+    conus.plot(
         ax=ax_main,
-        color="salmon",
+        column="status",
+        categorical=True,
+        cmap=COVERAGE_CMAP,
         edgecolor="gray",
         linewidth=0.1,
-        label="Missing Data",
+        legend=True,
+        legend_kwds={"loc": "lower left", "fontsize": 10},
     )
 
     ax_main.set_title(
@@ -84,25 +200,21 @@ def create_missing_counties_map():
     )
     ax_main.set_xlabel("Longitude")
     ax_main.set_ylabel("Latitude")
-    ax_main.legend(loc="lower left", fontsize=10)
     ax_main.set_xlim(-130, -65)
     ax_main.set_ylim(24, 50)
 
     # Alaska
-    ax_ak = plt.subplot(2, 3, 2)
-    alaska = counties_shp[counties_shp["STATEFP"] == "02"]
+    ax_ak = fig.add_subplot(2, 3, 2)
+    alaska = counties_shp.loc[state_codes == 2]
     if len(alaska) > 0:
-        alaska_has = alaska[alaska["has_data"]]
-        alaska_missing = alaska[~alaska["has_data"]]
-
-        if len(alaska_has) > 0:
-            alaska_has.plot(
-                ax=ax_ak, color="lightgreen", edgecolor="gray", linewidth=0.2
-            )
-        if len(alaska_missing) > 0:
-            alaska_missing.plot(
-                ax=ax_ak, color="salmon", edgecolor="gray", linewidth=0.2
-            )
+        alaska.plot(
+            ax=ax_ak,
+            column="status",
+            categorical=True,
+            cmap=COVERAGE_CMAP,
+            edgecolor="gray",
+            linewidth=0.2,
+        )
 
         ax_ak.set_title("Alaska", fontsize=12)
         ax_ak.set_xticks([])
@@ -122,20 +234,17 @@ def create_missing_counties_map():
         )
 
     # Hawaii
-    ax_hi = plt.subplot(2, 3, 3)
-    hawaii = counties_shp[counties_shp["STATEFP"] == "15"]
+    ax_hi = fig.add_subplot(2, 3, 3)
+    hawaii = counties_shp.loc[state_codes == 15]
     if len(hawaii) > 0:
-        hawaii_has = hawaii[hawaii["has_data"]]
-        hawaii_missing = hawaii[~hawaii["has_data"]]
-
-        if len(hawaii_has) > 0:
-            hawaii_has.plot(
-                ax=ax_hi, color="lightgreen", edgecolor="gray", linewidth=0.2
-            )
-        if len(hawaii_missing) > 0:
-            hawaii_missing.plot(
-                ax=ax_hi, color="salmon", edgecolor="gray", linewidth=0.2
-            )
+        hawaii.plot(
+            ax=ax_hi,
+            column="status",
+            categorical=True,
+            cmap=COVERAGE_CMAP,
+            edgecolor="gray",
+            linewidth=0.2,
+        )
 
         ax_hi.set_title("Hawaii", fontsize=12)
         ax_hi.set_xticks([])
@@ -155,16 +264,17 @@ def create_missing_counties_map():
         )
 
     # Puerto Rico
-    ax_pr = plt.subplot(2, 3, 5)
-    puerto_rico = counties_shp[counties_shp["STATEFP"] == "72"]
+    ax_pr = fig.add_subplot(2, 3, 5)
+    puerto_rico = counties_shp.loc[state_codes == 72]
     if len(puerto_rico) > 0:
-        pr_has = puerto_rico[puerto_rico["has_data"]]
-        pr_missing = puerto_rico[~puerto_rico["has_data"]]
-
-        if len(pr_has) > 0:
-            pr_has.plot(ax=ax_pr, color="lightgreen", edgecolor="gray", linewidth=0.2)
-        if len(pr_missing) > 0:
-            pr_missing.plot(ax=ax_pr, color="salmon", edgecolor="gray", linewidth=0.2)
+        puerto_rico.plot(
+            ax=ax_pr,
+            column="status",
+            categorical=True,
+            cmap=COVERAGE_CMAP,
+            edgecolor="gray",
+            linewidth=0.2,
+        )
 
         ax_pr.set_title("Puerto Rico", fontsize=12)
         ax_pr.set_xticks([])
@@ -183,10 +293,7 @@ def create_missing_counties_map():
             fontsize=9,
         )
 
-    # Statistics panel
-    ax_stats = plt.subplot(2, 3, 6)
-    ax_stats.axis("off")
-
+    # Statistics panel (drawn as figure text in the free bottom-right cell)
     # Create statistics text
     stats_text = f"""
     Coverage Statistics:
@@ -199,41 +306,32 @@ def create_missing_counties_map():
     """
 
     # Calculate missing by state
+    state_counts = count_by_state(counties_shp)
+    missing_by_state = state_counts["missing"]
     missing_by_state = (
-        counties_shp[~counties_shp["has_data"]]
-        .groupby("STATEFP")
-        .size()
-        .sort_values(ascending=False)
-        .head(10)
+        missing_by_state[missing_by_state > 0].sort_values(ascending=False).head(10)
+    )
+    missing_by_state = missing_by_state.rename(
+        index=lambda code: STATE_NAMES.get(code, f"State {code}")
     )
-    state_names = {
-        "36": "New York",
-        "27": "Minnesota",
-        "42": "Pennsylvania",
-        "53": "Washington",
-        "55": "Wisconsin",
-        "51": "Virginia",
-        "26": "Michigan",
-        "41": "Oregon",
-        "06": "California",
-        "16": "Idaho",
-        "72": "Puerto Rico",
-    }
-
-    for state_code, count in missing_by_state.items():
-        state_name = state_names.get(state_code, f"State {state_code}")
-        stats_text += f"\n  • {state_name}: {count}"
-
-    ax_stats.text(
-        0.1,
-        0.9,
+    if len(missing_by_state):
+        stats_text += "\n" + "\n".join(
+            f"  • {state_name}: {count}"
+            for state_name, count in missing_by_state.items()
+        )
+
+    fig.text(
+        0.70,
+        0.45,
         stats_text,
-        transform=ax_stats.transAxes,
         fontsize=10,
         verticalalignment="top",
         fontfamily="monospace",
     )
 
+    stats_path = Path("climate_outputs/coverage_stats.txt")
+    stats_path.write_text(stats_text)
+
     # Overall title
     fig.suptitle(
         "US County Climate Data Coverage Analysis\n", fontsize=16, fontweight="bold"
@@ -249,30 +347,33 @@ def create_missing_counties_map():
         style="italic",
     )
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the figure
     output_path = "climate_outputs/missing_counties_map.png"
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
+    fig.savefig(
+        output_path, dpi=150, bbox_inches="tight", pil_kwargs={"optimize": True}
+    )
     print(f"\nMap saved to: {output_path}")
+    print(f"Coverage statistics saved to: {stats_path}")
 
     # Also create a detailed state-level summary
-    create_state_summary(counties_shp)
+    create_state_summary(counties_shp, state_counts)
 
-    plt.show()
+    if not HEADLESS:
+        plt.show()
+    if owns_fig:
+        plt.close(fig)
     return counties_shp
 
 
-def create_state_summary(counties_shp):
+def create_state_summary(counties_shp, state_counts=None):
     """Create a detailed state-level summary of missing counties."""
 
     # Calculate statistics by state
-    state_stats = (
-        counties_shp.groupby("STATEFP").agg({"has_data": ["sum", "count"]}).round(2)
-    )
-
-    state_stats.columns = ["processed", "total"]
-    state_stats["missing"] = state_stats["total"] - state_stats["processed"]
+    if state_counts is None:
+        state_counts = count_by_state(counties_shp)
+    state_stats = state_counts.copy()
     state_stats["coverage_pct"] = (
         state_stats["processed"] / state_stats["total"] * 100
     ).round(1)
@@ -18,6 +18,9 @@ from climate_zarr._version import __version__
 __author__ = "Chris Mihiar"
 __email__ = "chris.mihiar.fs@gmail.com"
 
+import importlib
+import importlib.util
+
 # Public API exports
 from climate_zarr.climate_config import (
     ClimateConfig,
@@ -27,22 +30,47 @@ from climate_zarr.climate_config import (
     ProcessingConfig,
     get_config,
 )
-from climate_zarr.stack_nc_to_zarr import (
-    stack_netcdf_to_zarr,
-    stack_netcdf_to_zarr_hierarchical,
-    generate_hierarchical_zarr_path,
-)
-from climate_zarr.county_processor import ModernCountyProcessor
-from climate_zarr.pipeline import PipelineConfig, PipelineResult, run_pipeline
-from climate_zarr.transform import merge_climate_dataframes
+
+# Heavyweight exports (xarray, zarr, geopandas, ...) are resolved on first
+# attribute access (PEP 562) so ``import climate_zarr`` stays cheap.
+_LAZY = {
+    "stack_netcdf_to_zarr": "climate_zarr.stack_nc_to_zarr",
+    "stack_netcdf_to_zarr_hierarchical": "climate_zarr.stack_nc_to_zarr",
+    "generate_hierarchical_zarr_path": "climate_zarr.stack_nc_to_zarr",
+    "ModernCountyProcessor": "climate_zarr.county_processor",
+    "PipelineConfig": "climate_zarr.pipeline",
+    "PipelineResult": "climate_zarr.pipeline",
+    "run_pipeline": "climate_zarr.pipeline",
+    "merge_climate_dataframes": "climate_zarr.transform",
+}
 
 # GEE subpackage (optional — requires earthengine-api)
-try:
-    from climate_zarr.gee import run_gee_pipeline, GEEPipelineConfig, GEEConfig
+_HAS_GEE = importlib.util.find_spec("ee") is not None
+if _HAS_GEE:
+    _LAZY.update(
+        {
+            "run_gee_pipeline": "climate_zarr.gee",
+            "GEEPipelineConfig": "climate_zarr.gee",
+            "GEEConfig": "climate_zarr.gee",
+        }
+    )
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-    _HAS_GEE = True
-except ImportError:
-    _HAS_GEE = False
 
 __all__ = [
     # Version info
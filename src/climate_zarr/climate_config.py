@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 """Modern configuration management for climate data processing."""
 
+import math
 from pathlib import Path
-from typing import Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from types import MappingProxyType
+from typing import Annotated, Dict, Mapping, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import os
 from datetime import datetime
 
@@ -38,27 +40,131 @@ class ChunkingConfig(BaseModel):
         """Convert to dictionary for xarray."""
         return {"time": self.time, "lat": self.lat, "lon": self.lon}
 
+    def for_region(
+        self,
+        region: "RegionConfig",
+        resolution: float = 0.25,
+        dtype_bytes: int = 4,
+        target_bytes: int = 4 * 1024 * 1024,
+    ) -> Dict[str, int]:
+        """Spatially local chunk sizes for a store clipped to ``region``.
+
+        County statistics read a small window per county, so chunks spanning
+        the whole region decompress mostly unrelated cells on every read.
+        Tiles aim for about 8 per axis, but are never smaller than a full
+        ``time`` chunk of roughly ``target_bytes`` allows, which keeps small
+        regions from fragmenting into tiny chunks.
+        """
+        lat_cells = max(1, math.ceil((region.lat_max - region.lat_min) / resolution))
+        lon_cells = max(1, math.ceil((region.lon_max - region.lon_min) / resolution))
+        side = max(1, math.isqrt(target_bytes // (self.time * dtype_bytes)))
+        return {
+            "time": self.time,
+            "lat": min(self.lat, lat_cells, max(math.ceil(lat_cells / 8), side)),
+            "lon": min(self.lon, lon_cells, max(math.ceil(lon_cells / 8), side)),
+        }
+
+
+# Default per-variable thresholds: heavy precipitation in mm/day, temperature
+# limits in degrees C
+DEFAULT_THRESHOLDS: Mapping[str, float] = MappingProxyType(
+    {"pr": 25.4, "tas": 0.0, "tasmax": 35.0, "tasmin": 0.0}
+)
+
+
+# Bounds are checked by pydantic-core constraints rather than Python validators
+Latitude = Annotated[float, Field(ge=-90, le=90)]
+Longitude = Annotated[float, Field(ge=-180, le=360)]
+
 
 class RegionConfig(BaseModel):
     """Geographic region configuration."""
 
-    name: str = Field(description="Region name")
-    lat_min: float = Field(description="Minimum latitude")
-    lat_max: float = Field(description="Maximum latitude")
-    lon_min: float = Field(description="Minimum longitude")
-    lon_max: float = Field(description="Maximum longitude")
-
-    @field_validator("lat_min", "lat_max")
-    def validate_latitude(cls, v):
-        if not -90 <= v <= 90:
-            raise ValueError("Latitude must be between -90 and 90")
-        return v
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("lon_min", "lon_max")
-    def validate_longitude(cls, v):
-        if not -180 <= v <= 360:
-            raise ValueError("Longitude must be between -180 and 360")
-        return v
+    name: str = Field(description="Region name")
+    lat_min: Latitude = Field(description="Minimum latitude")
+    lat_max: Latitude = Field(description="Maximum latitude")
+    lon_min: Longitude = Field(description="Minimum longitude")
+    lon_max: Longitude = Field(description="Maximum longitude")
+
+
+# Predefined regions, validated once at import. RegionConfig is frozen, so
+# every ClimateConfig can share these instances.
+_DEFAULT_REGIONS: Mapping[str, RegionConfig] = MappingProxyType(
+    {
+        "conus": RegionConfig(
+            name="CONUS", lat_min=24.0, lat_max=50.0, lon_min=-125.0, lon_max=-66.0
+        ),
+        "alaska": RegionConfig(
+            name="Alaska",
+            lat_min=54.0,
+            lat_max=72.0,
+            lon_min=-180.0,
+            lon_max=-129.0,
+        ),
+        "hawaii": RegionConfig(
+            name="Hawaii",
+            lat_min=18.0,
+            lat_max=29.0,  # Expanded to include Northwestern Hawaiian Islands
+            lon_min=-179.0,  # Expanded to include all of Honolulu County
+            lon_max=-154.0,
+        ),
+        "guam": RegionConfig(
+            name="Guam/MP", lat_min=13.0, lat_max=21.0, lon_min=144.0, lon_max=146.0
+        ),
+        "puerto_rico": RegionConfig(
+            name="Puerto Rico/USVI",
+            lat_min=17.5,
+            lat_max=18.6,
+            lon_min=-68.0,  # Expanded to include Mayagüez
+            lon_max=-64.5,
+        ),
+        "global": RegionConfig(
+            name="Global",
+            lat_min=-90.0,
+            lat_max=90.0,
+            lon_min=-180.0,
+            lon_max=180.0,
+        ),
+    }
+)
+
+
+# FIPS state codes to two-letter abbreviations (matches base_processor.py)
+STATE_FIPS_TO_ABBR: MappingProxyType[str, str] = MappingProxyType({
+    "01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA",
+    "08": "CO", "09": "CT", "10": "DE", "11": "DC", "12": "FL",
+    "13": "GA", "15": "HI", "16": "ID", "17": "IL", "18": "IN",
+    "19": "IA", "20": "KS", "21": "KY", "22": "LA", "23": "ME",
+    "24": "MD", "25": "MA", "26": "MI", "27": "MN", "28": "MS",
+    "29": "MO", "30": "MT", "31": "NE", "32": "NV", "33": "NH",
+    "34": "NJ", "35": "NM", "36": "NY", "37": "NC", "38": "ND",
+    "39": "OH", "40": "OK", "41": "OR", "42": "PA", "44": "RI",
+    "45": "SC", "46": "SD", "47": "TN", "48": "TX", "49": "UT",
+    "50": "VT", "51": "VA", "53": "WA", "54": "WV", "55": "WI",
+    "56": "WY", "60": "AS", "66": "GU", "69": "MP", "72": "PR",
+    "78": "VI",
+})
+
+# CONUS state FIPS codes (excludes territories and non-contiguous states)
+CONUS_STATE_FIPS: frozenset[str] = frozenset(
+    fips for fips, abbr in STATE_FIPS_TO_ABBR.items()
+    if abbr not in {"AK", "HI", "AS", "GU", "MP", "PR", "VI"}
+)
+
+# State FIPS codes per region. GEE county filtering uses STATEFP for these
+# regions instead of filterBounds, which duplicates features that straddle
+# spatial-index tile boundaries (observed for 18 Wisconsin counties) and
+# drops features whose geometry extends beyond the bbox (6 south FL/TX
+# counties). Codes are pre-sorted for ee.List.
+REGION_FIPS: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    "conus": tuple(sorted(CONUS_STATE_FIPS)),
+    "alaska": ("02",),
+    "hawaii": ("15",),
+    "guam": ("66", "69"),
+    "puerto_rico": ("72", "78"),
+})
 
 
 class ProcessingConfig(BaseModel):
@@ -117,12 +223,13 @@ class OutputConfig(BaseModel):
         region: Optional[str] = None,
         scenario: Optional[str] = None,
         output_type: str = "stats",
+        now: Optional[datetime] = None,
     ) -> Path:
         """Generate organized output directory path."""
         base_dir = self.base_output_dir
 
         if self.include_timestamp:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
             base_dir = base_dir / f"run_{timestamp}"
 
         if not self.create_subdirs:
@@ -151,6 +258,7 @@ class OutputConfig(BaseModel):
         file_extension: str = "csv",
         custom_suffix: Optional[str] = None,
         threshold: Optional[float] = None,
+        now: Optional[datetime] = None,
     ) -> str:
         """Generate standardized filename based on naming convention."""
 
@@ -170,7 +278,7 @@ class OutputConfig(BaseModel):
 
         elif self.naming_convention == "detailed":
             # Detailed: region_scenario_variable_outputtype_YYYYMMDD.ext
-            date_str = datetime.now().strftime(self.date_format)
+            date_str = (now or datetime.now()).strftime(self.date_format)
             parts = [region, scenario, variable, output_type, date_str]
             if threshold is not None:
                 thresh_str = f"t{threshold}".replace(".", "p")
@@ -179,7 +287,7 @@ class OutputConfig(BaseModel):
 
         elif self.naming_convention == "iso":
             # ISO-style: YYYY-MM-DD_region_variable_scenario.ext
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = (now or datetime.now()).strftime("%Y-%m-%d")
             parts = [date_str, region, variable, scenario]
             if output_type != "stats":
                 parts.append(output_type)
@@ -212,9 +320,14 @@ class OutputConfig(BaseModel):
         file_extension: str = "csv",
         custom_suffix: Optional[str] = None,
         threshold: Optional[float] = None,
+        now: Optional[datetime] = None,
     ) -> Path:
         """Get complete output path with directory and filename."""
-        output_dir = self.get_output_directory(variable, region, scenario, output_type)
+        # One timestamp for both parts so they cannot straddle midnight
+        now = now or datetime.now()
+        output_dir = self.get_output_directory(
+            variable, region, scenario, output_type, now
+        )
         filename = self.generate_filename(
             variable,
             region,
@@ -223,6 +336,7 @@ class OutputConfig(BaseModel):
             file_extension,
             custom_suffix,
             threshold,
+            now,
         )
         return output_dir / filename
 
@@ -237,42 +351,12 @@ class ClimateConfig(BaseModel):
 
     # Predefined regions
     regions: Dict[str, RegionConfig] = Field(
-        default_factory=lambda: {
-            "conus": RegionConfig(
-                name="CONUS", lat_min=24.0, lat_max=50.0, lon_min=-125.0, lon_max=-66.0
-            ),
-            "alaska": RegionConfig(
-                name="Alaska",
-                lat_min=54.0,
-                lat_max=72.0,
-                lon_min=-180.0,
-                lon_max=-129.0,
-            ),
-            "hawaii": RegionConfig(
-                name="Hawaii",
-                lat_min=18.0,
-                lat_max=29.0,  # Expanded to include Northwestern Hawaiian Islands
-                lon_min=-179.0,  # Expanded to include all of Honolulu County
-                lon_max=-154.0,
-            ),
-            "guam": RegionConfig(
-                name="Guam/MP", lat_min=13.0, lat_max=21.0, lon_min=144.0, lon_max=146.0
-            ),
-            "puerto_rico": RegionConfig(
-                name="Puerto Rico/USVI",
-                lat_min=17.5,
-                lat_max=18.6,
-                lon_min=-68.0,  # Expanded to include Mayagüez
-                lon_max=-64.5,
-            ),
-            "global": RegionConfig(
-                name="Global",
-                lat_min=-90.0,
-                lat_max=90.0,
-                lon_min=-180.0,
-                lon_max=180.0,
-            ),
-        }
+        default_factory=lambda: dict(_DEFAULT_REGIONS)
+    )
+
+    variable_thresholds: Dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_THRESHOLDS),
+        description="Default threshold per climate variable",
     )
 
     # File paths
@@ -297,6 +381,13 @@ class ClimateConfig(BaseModel):
     enable_caching: bool = Field(default=True, description="Enable result caching")
     cache_dir: Optional[Path] = Field(default=None, description="Cache directory")
 
+    # Shared by every timestamped output name generated from this config
+    run_started_at: datetime = Field(
+        default_factory=datetime.now,
+        exclude=True,
+        description="Timestamp used for dated output paths",
+    )
+
     @field_validator("default_output_dir", "temp_dir", "cache_dir", mode="before")
     def validate_paths(cls, v):
         if v is not None:
@@ -345,6 +436,13 @@ class ClimateConfig(BaseModel):
         if level := os.getenv("CLIMATE_COMPRESSION_LEVEL"):
             config_data.setdefault("compression", {})["level"] = int(level)
 
+        # Per-variable thresholds, e.g. CLIMATE_THRESHOLD_TASMAX=32
+        for variable in DEFAULT_THRESHOLDS:
+            if threshold := os.getenv(f"CLIMATE_THRESHOLD_{variable.upper()}"):
+                config_data.setdefault(
+                    "variable_thresholds", dict(DEFAULT_THRESHOLDS)
+                )[variable] = float(threshold)
+
         # Output directory
         if output_dir := os.getenv("CLIMATE_OUTPUT_DIR"):
             config_data["default_output_dir"] = output_dir
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Modern county processor that replaces the monolithic implementation."""
 
+import hashlib
 from pathlib import Path
 from typing import Dict, Optional
 import pandas as pd
@@ -14,6 +15,7 @@ from .processors import (
     TasMaxProcessor,
     TasMinProcessor,
 )
+from .climate_config import get_config
 from .utils.output_utils import get_output_manager
 
 console = Console()
@@ -26,6 +28,14 @@ class ModernCountyProcessor:
     modular architecture that delegates to specialized processors.
     """
 
+    # Keyword each processor takes its threshold under (None: no threshold)
+    _THRESHOLD_KWARGS: Dict[str, Optional[str]] = {
+        "pr": "threshold_mm",
+        "tas": None,
+        "tasmax": "threshold_temp_c",
+        "tasmin": None,
+    }
+
     def __init__(self, n_workers: int = 4):
         """Initialize the modern county processor.
 
@@ -42,6 +52,12 @@ class ModernCountyProcessor:
             "tasmin": TasMinProcessor(n_workers),
         }
 
+        # Prepared county frames, shared across variables
+        self._shape_cache: Dict[str, gpd.GeoDataFrame] = {}
+        # Opened Zarr stores by resolved path, with the metadata version
+        # they were opened at
+        self._datasets: Dict[str, tuple] = {}
+
     def prepare_shapefile(
         self, shapefile_path: Path, target_crs: str = "EPSG:4326"
     ) -> gpd.GeoDataFrame:
@@ -53,9 +69,61 @@ class ModernCountyProcessor:
 
         Returns:
             Prepared GeoDataFrame with standardized columns
+
+        Prepared frames are memoized on this processor, keyed on the
+        shapefile's path, modification time and target CRS. Each call returns
+        its own copy, so callers may modify it freely. When caching is enabled and a
+        ``cache_dir`` is configured, they are also stored as GeoParquet so
+        later runs skip the reprojection.
         """
-        # Use the first processor's method (they all have the same implementation)
-        return self._processors["pr"].prepare_shapefile(shapefile_path, target_crs)
+        shapefile_path = Path(shapefile_path)
+        key = self._shapefile_key(shapefile_path, target_crs)
+        if key is not None and key in self._shape_cache:
+            return self._shape_cache[key].copy()
+
+        cache_path = self._shapefile_cache_path(shapefile_path, key)
+        gdf = None
+        if cache_path is not None and cache_path.exists():
+            try:
+                gdf = gpd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError):
+                gdf = None
+
+        if gdf is None:
+            # Use the first processor's method (they all have the same implementation)
+            gdf = self._processors["pr"].prepare_shapefile(shapefile_path, target_crs)
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    gdf.to_parquet(cache_path, compression="zstd")
+                except (ImportError, OSError, ValueError):
+                    pass
+
+        if key is not None:
+            self._shape_cache[key] = gdf
+            return gdf.copy()
+        return gdf
+
+    @staticmethod
+    def _shapefile_key(shapefile_path: Path, target_crs: str) -> Optional[str]:
+        """Identify a prepared shapefile by path, modification time and CRS."""
+        try:
+            mtime_ns = shapefile_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        return hashlib.sha1(
+            f"{shapefile_path.resolve()}|{mtime_ns}|{target_crs}".encode()
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def _shapefile_cache_path(
+        shapefile_path: Path, key: Optional[str]
+    ) -> Optional[Path]:
+        """Return the GeoParquet cache location for a shapefile, if caching applies."""
+        config = get_config()
+        if key is None or not config.enable_caching or config.cache_dir is None:
+            return None
+        return Path(config.cache_dir) / f"counties_{shapefile_path.stem}_{key}.parquet"
 
     def process_zarr_data(
         self,
@@ -90,8 +158,7 @@ class ModernCountyProcessor:
         # Get the appropriate processor
         processor = self._processors[variable]
 
-        # Open the dataset using native Zarr chunks to avoid rechunking overhead
-        ds = xr.open_zarr(zarr_path)
+        ds = self._open_zarr(Path(zarr_path))
 
         # Check if variable exists in dataset
         if variable not in ds.data_vars:
@@ -102,23 +169,57 @@ class ModernCountyProcessor:
         # Get the data array
         data = ds[variable]
 
-        # Process based on variable type
-        if variable == "pr":
-            return processor.process_variable_data(
-                data=data, gdf=gdf, scenario=scenario, threshold_mm=threshold
-            )
-        elif variable == "tas":
-            return processor.process_variable_data(
-                data=data, gdf=gdf, scenario=scenario
-            )
-        elif variable == "tasmax":
-            return processor.process_variable_data(
-                data=data, gdf=gdf, scenario=scenario, threshold_temp_c=threshold
-            )
-        elif variable == "tasmin":
-            return processor.process_variable_data(
-                data=data, gdf=gdf, scenario=scenario
-            )
+        threshold_kwargs = {}
+        threshold_kwarg = self._THRESHOLD_KWARGS[variable]
+        if threshold_kwarg is not None:
+            threshold_kwargs[threshold_kwarg] = threshold
+        return processor.process_variable_data(
+            data=data, gdf=gdf, scenario=scenario, **threshold_kwargs
+        )
+
+    # Top-level metadata rewritten by every append or re-consolidation:
+    # zarr v3 stores and consolidated v2 stores
+    _STORE_METADATA_FILES = ("zarr.json", ".zmetadata")
+
+    @classmethod
+    def _store_version(cls, zarr_path: Path) -> int:
+        """Modification time of the store's top-level metadata file.
+
+        Appends write chunks and array metadata in subdirectories, which
+        leaves the store directory's own mtime unchanged, so the consolidated
+        metadata file is the reliable marker. Unconsolidated v2 stores fall
+        back to the directory.
+        """
+        for name in cls._STORE_METADATA_FILES:
+            try:
+                return (zarr_path / name).stat().st_mtime_ns
+            except OSError:
+                continue
+        return zarr_path.stat().st_mtime_ns
+
+    def _open_zarr(self, zarr_path: Path) -> xr.Dataset:
+        """Open a Zarr store once per processor, reusing it on later calls.
+
+        xarray maps Dask chunks one-to-one onto the on-disk chunks, so each
+        county window reads only the chunks it touches. A store whose
+        metadata has been rewritten since it was opened replaces the cached
+        dataset.
+        """
+        try:
+            key = str(zarr_path.resolve())
+            version = self._store_version(zarr_path)
+        except OSError:
+            # Let xarray report missing or unreadable stores as before
+            return xr.open_zarr(zarr_path)
+        cached = self._datasets.get(key)
+        if cached is not None:
+            cached_version, ds = cached
+            if cached_version == version:
+                return ds
+            ds.close()
+        ds = xr.open_zarr(zarr_path)
+        self._datasets[key] = (version, ds)
+        return ds
 
     def get_processor(self, variable: str):
         """Get the processor for a specific variable.
@@ -142,6 +243,8 @@ class ModernCountyProcessor:
         threshold: Optional[float] = None,
         output_path: Optional[Path] = None,
         metadata: Optional[Dict] = None,
+        output_format: str = "csv",
+        data_summary: Optional[Dict] = None,
     ) -> Path:
         """Save results using standardized output management.
 
@@ -153,16 +256,28 @@ class ModernCountyProcessor:
             threshold: Threshold value used
             output_path: Custom output path (optional)
             metadata: Additional metadata (optional)
+            output_format: "csv" or "parquet" (zstd-compressed, requires pyarrow)
+            data_summary: Precomputed ``counties_processed``/``years_processed``/
+                ``total_records`` counts (optional; computed from results_df if omitted)
 
         Returns:
             Path where results were saved
         """
         output_manager = get_output_manager()
 
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Unsupported output format: {output_format}")
+
         if output_path is None:
             output_path = output_manager.get_output_path(
-                variable=variable, region=region, scenario=scenario, threshold=threshold
+                variable=variable,
+                region=region,
+                scenario=scenario,
+                threshold=threshold,
+                file_extension=output_format,
             )
+        elif output_format == "parquet":
+            output_path = Path(output_path).with_suffix(".parquet")
 
         # Prepare metadata
         save_metadata = {
@@ -173,11 +288,12 @@ class ModernCountyProcessor:
                 "threshold": threshold,
                 "n_workers": self.n_workers,
             },
-            "data_summary": {
-                "counties_processed": len(results_df["county_id"].unique())
+            "data_summary": data_summary
+            or {
+                "counties_processed": int(results_df["county_id"].nunique(dropna=False))
                 if "county_id" in results_df.columns
                 else len(results_df),
-                "years_processed": len(results_df["year"].unique())
+                "years_processed": int(results_df["year"].nunique(dropna=False))
                 if "year" in results_df.columns
                 else "unknown",
                 "total_records": len(results_df),
@@ -192,13 +308,16 @@ class ModernCountyProcessor:
             data=results_df,
             output_path=output_path,
             metadata=save_metadata,
-            save_method="csv",
+            save_method=output_format,
         )
 
     def close(self):
         """Clean up resources for all processors."""
         for processor in self._processors.values():
             processor.close()
+        for _, ds in self._datasets.values():
+            ds.close()
+        self._datasets.clear()
 
     def __enter__(self):
         """Context manager entry."""
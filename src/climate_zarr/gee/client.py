@@ -1,51 +1,123 @@
 """GEE connection, authentication, and data access helpers."""
 
+import os
+from typing import Optional
+
 import ee
 from rich.console import Console
 
-from climate_zarr.climate_config import get_config
+from climate_zarr.climate_config import (
+    CONUS_STATE_FIPS as CONUS_STATE_FIPS,
+    REGION_FIPS,
+    STATE_FIPS_TO_ABBR,
+    get_config,
+)
 
 console = Console()
 
-# FIPS state codes to two-letter abbreviations (matches base_processor.py)
-STATE_FIPS_TO_ABBR: dict[str, str] = {
-    "01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA",
-    "08": "CO", "09": "CT", "10": "DE", "11": "DC", "12": "FL",
-    "13": "GA", "15": "HI", "16": "ID", "17": "IL", "18": "IN",
-    "19": "IA", "20": "KS", "21": "KY", "22": "LA", "23": "ME",
-    "24": "MD", "25": "MA", "26": "MI", "27": "MN", "28": "MS",
-    "29": "MO", "30": "MT", "31": "NE", "32": "NV", "33": "NH",
-    "34": "NJ", "35": "NM", "36": "NY", "37": "NC", "38": "ND",
-    "39": "OH", "40": "OK", "41": "OR", "42": "PA", "44": "RI",
-    "45": "SC", "46": "SD", "47": "TN", "48": "TX", "49": "UT",
-    "50": "VT", "51": "VA", "53": "WA", "54": "WV", "55": "WI",
-    "56": "WY", "60": "AS", "66": "GU", "69": "MP", "72": "PR",
-    "78": "VI",
-}
-
-# CONUS state FIPS codes (excludes territories and non-contiguous states)
-CONUS_STATE_FIPS: set[str] = {
-    fips for fips, abbr in STATE_FIPS_TO_ABBR.items()
-    if abbr not in {"AK", "HI", "AS", "GU", "MP", "PR", "VI"}
-}
-
-
-def initialize_gee(project_id: str) -> None:
+# Endpoint recommended by Google for automated, highly concurrent requests
+HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+# Fragments of the EEException ee raises when no usable credentials are
+# stored; any other initialization failure (disabled API, wrong project,
+# missing permission) is not fixed by authenticating again
+MISSING_CREDENTIALS_MESSAGES = (
+    "authorize access",
+    "earthengine authenticate",
+    "credentials",
+)
+
+# (project, high_volume) of the current ee session; ee holds one global
+# session, so only the latest initialization can be reused
+_ACTIVE_SESSION: Optional[tuple[str, bool]] = None
+
+# Standardized county collections per (region, asset); ee objects are
+# immutable graph descriptions, so one instance can serve every request
+_COUNTY_CACHE: dict[tuple[str, str], ee.FeatureCollection] = {}
+
+
+def initialize_gee(
+    project_id: str, high_volume: bool = False, max_connections: int = 10
+) -> None:
     """Authenticate (if needed) and initialize the Earth Engine API.
 
+    Stored credentials are tried first. If they are missing, a service
+    account is used when ``GEE_SA_EMAIL`` and ``GEE_SA_KEY_PATH`` are set,
+    so headless runs never block on the interactive browser flow; otherwise
+    falls back to ``ee.Authenticate()``. Other initialization errors are
+    raised unchanged. Repeat calls for an already initialized session
+    return immediately.
+
     Parameters
     ----------
     project_id : str
         Google Cloud project with Earth Engine enabled.
+    high_volume : bool
+        Route requests through the high-volume endpoint, which serves many
+        concurrent ``getInfo()`` calls but is not meant for batch exports.
+    max_connections : int
+        Keep-alive connections pooled per host; match the number of
+        concurrent requests so none of them opens a fresh TLS connection.
     """
+    global _ACTIVE_SESSION
+
+    session = (project_id, high_volume)
+    if session == _ACTIVE_SESSION:
+        _size_connection_pool(max_connections)
+        return
+    endpoint_kwargs = {"opt_url": HIGH_VOLUME_URL} if high_volume else {}
+
     try:
-        ee.Initialize(project=project_id)
+        ee.Initialize(project=project_id, **endpoint_kwargs)
         console.print(f"[green]GEE initialized with project '{project_id}'[/green]")
-    except Exception:
-        console.print("[yellow]GEE not initialized, attempting authentication...[/yellow]")
-        ee.Authenticate()
-        ee.Initialize(project=project_id)
-        console.print(f"[green]GEE authenticated and initialized with project '{project_id}'[/green]")
+    except ee.EEException as error:
+        if not _is_missing_credentials(error):
+            raise
+        service_account = os.environ.get("GEE_SA_EMAIL")
+        key_path = os.environ.get("GEE_SA_KEY_PATH")
+        if service_account and key_path:
+            credentials = ee.ServiceAccountCredentials(service_account, key_path)
+            ee.Initialize(credentials, project=project_id, **endpoint_kwargs)
+            console.print(
+                f"[green]GEE initialized with service account '{service_account}' "
+                f"for project '{project_id}'[/green]"
+            )
+        else:
+            console.print("[yellow]GEE not initialized, attempting authentication...[/yellow]")
+            ee.Authenticate()
+            ee.Initialize(project=project_id, **endpoint_kwargs)
+            console.print(f"[green]GEE authenticated and initialized with project '{project_id}'[/green]")
+
+    _ACTIVE_SESSION = session
+    _size_connection_pool(max_connections)
+
+
+def _is_missing_credentials(error: Exception) -> bool:
+    """Return True if an ``ee.Initialize`` failure means "not authenticated"."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in MISSING_CREDENTIALS_MESSAGES)
+
+
+def _size_connection_pool(max_connections: int) -> None:
+    """Grow the keep-alive pool of ee's shared ``requests.Session``.
+
+    ee sends every call through one session, but requests pools only 10
+    connections per host; with more requests in flight, surplus connections
+    are dropped and re-opened with a new TLS handshake. ee releases without
+    a shared session are left untouched.
+    """
+    import requests
+
+    get_state = getattr(ee.data, "_get_state", None)
+    if get_state is None:
+        return
+    http_session = getattr(get_state(), "requests_session", None)
+    if not isinstance(http_session, requests.Session):
+        return
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=max_connections, pool_maxsize=max_connections
+    )
+    http_session.mount("https://", adapter)
 
 
 def get_cmip6_collection(
@@ -96,7 +168,8 @@ def get_county_features(
 
     Adds ``county_id``, ``county_name``, and ``state`` properties to each
     feature so downstream code can build DataFrames that match the existing
-    pipeline schema.
+    pipeline schema. Collections are built once per region and asset and
+    reused on later calls.
 
     Parameters
     ----------
@@ -110,27 +183,18 @@ def get_county_features(
     ee.FeatureCollection
         County features with standardized properties.
     """
+    cache_key = (region, county_asset)
+    if cache_key in _COUNTY_CACHE:
+        return _COUNTY_CACHE[cache_key]
+
     climate_config = get_config()
     region_config = climate_config.get_region(region)
 
     counties = ee.FeatureCollection(county_asset)
 
-    # Use STATEFP filtering instead of filterBounds wherever possible.
-    # GEE's filterBounds duplicates features that straddle spatial-index
-    # tile boundaries (observed for 18 Wisconsin counties) and drops
-    # features whose geometry extends beyond the bbox (6 south FL/TX counties).
-    _REGION_FIPS: dict[str, set[str]] = {
-        "conus": CONUS_STATE_FIPS,
-        "alaska": {"02"},
-        "hawaii": {"15"},
-        "guam": {"66", "69"},
-        "puerto_rico": {"72", "78"},
-    }
-
-    if region in _REGION_FIPS:
-        fips_set = _REGION_FIPS[region]
+    if region in REGION_FIPS:
         counties = counties.filter(
-            ee.Filter.inList("STATEFP", ee.List(sorted(fips_set)))
+            ee.Filter.inList("STATEFP", ee.List(list(REGION_FIPS[region])))
         )
     else:
         # For "global" or unknown regions, fall back to bounding-box filter
@@ -141,7 +205,7 @@ def get_county_features(
         counties = counties.filterBounds(region_geometry)
 
     # Map standardized properties onto each feature
-    state_fips_dict = ee.Dictionary(STATE_FIPS_TO_ABBR)
+    state_fips_dict = ee.Dictionary(dict(STATE_FIPS_TO_ABBR))
 
     def add_standard_properties(feature: ee.Feature) -> ee.Feature:
         geoid = feature.get("GEOID")
@@ -161,4 +225,5 @@ def get_county_features(
         f"(bounds: {region_config.lon_min},{region_config.lat_min} to "
         f"{region_config.lon_max},{region_config.lat_max})[/green]"
     )
+    _COUNTY_CACHE[cache_key] = counties
     return counties
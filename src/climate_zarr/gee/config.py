@@ -1,14 +1,15 @@
 """Pydantic v2 configuration models for the Google Earth Engine pipeline."""
 
+import warnings
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from climate_zarr.climate_config import get_config
+from climate_zarr.climate_config import REGION_FIPS, get_config
 
-SUPPORTED_VARIABLES = ("pr", "tas", "tasmax", "tasmin")
+SUPPORTED_VARIABLES = frozenset({"pr", "tas", "tasmax", "tasmin"})
 
 
 class ExportBackend(str, Enum):
@@ -21,6 +22,8 @@ class ExportBackend(str, Enum):
 class GEEConfig(BaseModel):
     """Google Earth Engine authentication and project settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     project_id: str = Field(description="Google Cloud project ID for GEE access")
     collection_id: str = Field(
         default="NASA/GDDP-CMIP6",
@@ -34,11 +37,24 @@ class GEEConfig(BaseModel):
         default="TIGER/2018/Counties",
         description="GEE FeatureCollection ID for US county boundaries",
     )
-    batch_size: int = Field(
-        default=1,
+    batch_size: Optional[int] = Field(
+        default=None,
         ge=1,
         le=20,
-        description="Years per GEE getInfo() call (CONUS ~3,100 counties × batch_size must stay under 5,000)",
+        description=(
+            "Years per GEE getInfo() call (counties × batch_size must stay under 5,000); "
+            "None sizes batches from the region's county count"
+        ),
+    )
+    max_concurrent_requests: int = Field(
+        default=4,
+        ge=1,
+        le=40,
+        description="Year batches requested from GEE concurrently (interactive quota allows ~40)",
+    )
+    high_volume_endpoint: bool = Field(
+        default=False,
+        description="Send getInfo() requests to the high-volume endpoint (sequential mode only)",
     )
     export_backend: ExportBackend = Field(
         default=ExportBackend.ASSET,
@@ -75,6 +91,8 @@ class GEEConfig(BaseModel):
 class GEEPipelineConfig(BaseModel):
     """Full pipeline configuration for the GEE data source."""
 
+    model_config = ConfigDict(frozen=True)
+
     gee: GEEConfig = Field(description="GEE-specific settings")
     models: list[str] = Field(
         default=["NorESM2-LM"],
@@ -116,13 +134,22 @@ class GEEPipelineConfig(BaseModel):
     @field_validator("region")
     @classmethod
     def validate_region(cls, region_value: str) -> str:
-        config = get_config()
-        if region_value.lower() not in config.regions:
-            available_regions = list(config.regions.keys())
+        # ``regions`` is a dict, so membership is already a hash lookup; the
+        # sorted name list is only built for the error message.
+        regions = get_config().regions
+        region_key = region_value.lower()
+        if region_key not in regions:
             raise ValueError(
-                f"Unknown region '{region_value}'. Available: {available_regions}"
+                f"Unknown region '{region_value}'. Available: {sorted(regions)}"
+            )
+        if region_key not in REGION_FIPS:
+            warnings.warn(
+                f"Region '{region_key}' has no state FIPS mapping; counties will "
+                "be selected with filterBounds, which is slower and can "
+                "duplicate or drop features at the region edge",
+                stacklevel=2,
             )
-        return region_value.lower()
+        return region_key
 
     @field_validator("variables", mode="before")
     @classmethod
@@ -132,7 +159,7 @@ class GEEPipelineConfig(BaseModel):
             if variable_name not in SUPPORTED_VARIABLES:
                 raise ValueError(
                     f"Unsupported variable '{variable_name}'. "
-                    f"Supported: {SUPPORTED_VARIABLES}"
+                    f"Supported: {sorted(SUPPORTED_VARIABLES)}"
                 )
         return variables_tuple
 
@@ -152,9 +179,10 @@ class GEEPipelineConfig(BaseModel):
     def set_defaults(self) -> "GEEPipelineConfig":
         if self.output_file is None:
             scenario_label = "_".join(self.scenarios)
-            self.output_file = (
-                self.output_dir
-                / "gee"
-                / f"{self.region}_{scenario_label}_climate_stats.csv"
+            # Frozen model: bypass the assignment guard for this one-time default
+            object.__setattr__(
+                self,
+                "output_file",
+                self.output_dir / "gee" / f"{self.region}_{scenario_label}_climate_stats.csv",
             )
         return self
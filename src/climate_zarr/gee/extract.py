@@ -6,7 +6,12 @@ existing local pipeline output so ``transform.merge_climate_dataframes``
 works unmodified.
 """
 
+import random
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.client import RemoteDisconnected
 from typing import Callable
 
 import ee
@@ -18,6 +23,54 @@ from climate_zarr.gee.reducers import VARIABLE_REDUCERS
 
 console = Console()
 
+# getInfo() refuses collections with more than 5,000 elements
+GETINFO_MAX_FEATURES = 5000
+
+# Upper bound on years per request, matching GEEConfig.batch_size, to stay
+# within the interactive ~5 minute compute limit
+MAX_BATCH_YEARS = 20
+
+try:
+    from urllib3.exceptions import ProtocolError
+except ImportError:  # pragma: no cover - urllib3 ships with earthengine-api
+    ProtocolError = ConnectionError
+
+try:
+    from googleapiclient.errors import HttpError
+except ImportError:  # pragma: no cover - google-api-python-client ships with earthengine-api
+    HttpError = None
+
+# Connection-level failures (e.g. laptop sleep) that are always worth retrying
+TRANSIENT_ERRORS = (RemoteDisconnected, socket.timeout, ProtocolError, ConnectionError)
+
+# HTTP statuses for throttling and server-side hiccups
+TRANSIENT_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# ee.EEException covers both quota/timeout errors and permanent ones such as
+# missing assets, so its message decides whether a retry can help
+TRANSIENT_EE_MESSAGES = (
+    "too many concurrent",
+    "rate limit",
+    "quota exceeded",
+    "timed out",
+    "deadline exceeded",
+    "internal error",
+    "service unavailable",
+    "backend error",
+)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Return True if a failed GEE request is worth retrying."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    if HttpError is not None and isinstance(error, HttpError):
+        return getattr(error.resp, "status", None) in TRANSIENT_HTTP_STATUSES
+    if isinstance(error, ee.EEException):
+        message = str(error).lower()
+        return any(fragment in message for fragment in TRANSIENT_EE_MESSAGES)
+    return False
+
 # Columns produced by each variable's reducer that we need in the DataFrame.
 # These must match the column names that transform.py expects.
 VARIABLE_OUTPUT_COLUMNS: dict[str, list[str]] = {
@@ -40,10 +93,129 @@ VARIABLE_OUTPUT_COLUMNS: dict[str, list[str]] = {
 }
 
 
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling GEE while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling GEE for a while after repeated transient failures.
+
+    ``failure_threshold`` consecutive transient failures open the circuit;
+    calls then fail fast with ``CircuitOpenError`` until ``reset_timeout``
+    seconds have passed, when a single half-open probe is let through. The
+    probe's outcome closes the circuit again or re-opens it. Shared by all
+    extraction threads, so state changes are guarded by a lock.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go through now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and self.seconds_until_probe() == 0:
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(
+                f"GEE circuit open after {self._failures} consecutive transient "
+                f"failures; retry in {self.seconds_until_probe():.0f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after GEE answered (even with a permanent error)."""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    console.print(
+                        f"[red]GEE circuit opened after {self._failures} consecutive "
+                        f"transient failures; pausing requests for "
+                        f"{self.reset_timeout:.0f}s[/red]"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Close the circuit and forget earlier failures."""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+
+    def seconds_until_probe(self) -> float:
+        """Seconds left before an open circuit admits a probe (0 if ready)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+
+# One breaker per process: ee holds a single session (project + endpoint).
+# run_gee_pipeline resets it so one run's outage doesn't leak into the next.
+GEE_CIRCUIT_BREAKER = CircuitBreaker()
+
+
+def _get_info_with_retry(
+    ee_object,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    jitter: float,
+):
+    """Run ``ee_object.getInfo()`` through the retry and circuit-breaker logic.
+
+    See ``extract_to_dataframe`` for the retry policy.
+    """
+    for attempt in range(1 + max_retries):
+        GEE_CIRCUIT_BREAKER.before_call()
+        try:
+            info = ee_object.getInfo()
+            GEE_CIRCUIT_BREAKER.record_success()
+            return info
+        except Exception as error:
+            error_class = type(error).__name__
+            if not is_transient_error(error):
+                GEE_CIRCUIT_BREAKER.record_success()
+                raise RuntimeError(
+                    f"GEE getInfo() failed ({error_class}, not retried): {error}"
+                ) from error
+            GEE_CIRCUIT_BREAKER.record_failure()
+            if attempt >= max_retries:
+                raise RuntimeError(
+                    f"GEE getInfo() failed after {1 + max_retries} attempts "
+                    f"({error_class}): {error}"
+                ) from error
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            delay *= 1 + random.uniform(0, jitter)
+            console.print(
+                f"  [yellow]getInfo() failed (attempt {attempt + 1}/{1 + max_retries}, "
+                f"{error_class}): {error} — retrying in {delay:.0f}s[/yellow]"
+            )
+            time.sleep(delay)
+
+
 def extract_to_dataframe(
     feature_collection: ee.FeatureCollection,
     max_retries: int = 3,
-    base_delay: float = 30.0,
+    base_delay: float = 5.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> pd.DataFrame:
     """Convert a GEE FeatureCollection to a pandas DataFrame.
 
@@ -51,8 +223,12 @@ def extract_to_dataframe(
     caller should keep the FeatureCollection small enough to avoid
     timeouts (~5 min limit for interactive calls).
 
-    Retries with exponential backoff on transient connection errors
-    (e.g. laptop sleep causing ``RemoteDisconnected``).
+    Transient failures (dropped connections, throttling, server errors;
+    see ``is_transient_error``) are retried with capped exponential backoff
+    plus random jitter, so concurrent batches don't retry in lockstep.
+    Permanent errors such as a missing asset fail immediately. Every call
+    goes through ``GEE_CIRCUIT_BREAKER``, so once GEE has failed repeatedly
+    further calls fail fast with ``CircuitOpenError`` instead of retrying.
 
     Parameters
     ----------
@@ -62,6 +238,10 @@ def extract_to_dataframe(
         Number of retry attempts on transient failures.
     base_delay : float
         Initial delay in seconds before first retry (doubles each attempt).
+    max_delay : float
+        Upper bound on the delay before jitter is applied.
+    jitter : float
+        Fraction of the delay added at random (0.5 -> up to +50%).
 
     Returns
     -------
@@ -71,26 +251,12 @@ def extract_to_dataframe(
     Raises
     ------
     RuntimeError
-        If the GEE ``getInfo()`` call fails after all retries.
+        If the GEE ``getInfo()`` call fails permanently or after all retries
+        (``CircuitOpenError`` while the circuit breaker is open).
     """
-    last_error = None
-    for attempt in range(1 + max_retries):
-        try:
-            info = feature_collection.getInfo()
-            break
-        except Exception as error:
-            last_error = error
-            if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)
-                console.print(
-                    f"  [yellow]getInfo() failed (attempt {attempt + 1}/{1 + max_retries}): "
-                    f"{error} — retrying in {delay:.0f}s[/yellow]"
-                )
-                time.sleep(delay)
-            else:
-                raise RuntimeError(
-                    f"GEE getInfo() failed after {1 + max_retries} attempts: {last_error}"
-                ) from last_error
+    info = _get_info_with_retry(
+        feature_collection, max_retries, base_delay, max_delay, jitter
+    )
 
     features = info.get("features", [])
     if not features:
@@ -100,6 +266,28 @@ def extract_to_dataframe(
     return pd.DataFrame(rows)
 
 
+def count_features(
+    feature_collection: ee.FeatureCollection,
+    max_retries: int = 3,
+    base_delay: float = 5.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+) -> int:
+    """Number of features in a collection, fetched like ``extract_to_dataframe``.
+
+    Raises
+    ------
+    RuntimeError
+        If the ``getInfo()`` call fails permanently or after all retries
+        (``CircuitOpenError`` while the circuit breaker is open).
+    """
+    return int(
+        _get_info_with_retry(
+            feature_collection.size(), max_retries, base_delay, max_delay, jitter
+        )
+    )
+
+
 def build_feature_collection(
     variable: str,
     year: int,
@@ -253,6 +441,17 @@ def postprocess_variable_dataframe(
     return combined_dataframe
 
 
+def auto_batch_size(n_counties: int) -> int:
+    """Largest years-per-request that keeps one ``getInfo()`` under its limit.
+
+    Each year contributes one feature per county, so small regions can pull
+    many years per round trip while CONUS (~3,100 counties) stays at one.
+    """
+    if n_counties <= 0:
+        return MAX_BATCH_YEARS
+    return max(1, min(MAX_BATCH_YEARS, (GETINFO_MAX_FEATURES - 1) // n_counties))
+
+
 def process_variable_year_batch(
     variable: str,
     years: list[int],
@@ -316,10 +515,12 @@ def build_variable_dataframe(
     collection_id: str = "NASA/GDDP-CMIP6",
     scale: int = 27830,
     batch_size: int = 5,
+    max_concurrent_requests: int = 4,
 ) -> pd.DataFrame:
     """Build the complete per-variable DataFrame over a year range.
 
-    Iterates year batches with a rich progress bar.  The returned
+    Year batches are requested concurrently (each ``getInfo()`` is a
+    blocking HTTP round trip) and tracked with a rich progress bar.  The returned
     DataFrame has the same column schema as the existing local
     pipeline's per-variable output.
 
@@ -339,6 +540,8 @@ def build_variable_dataframe(
         Processing resolution in meters.
     batch_size : int
         Years per ``getInfo()`` call.
+    max_concurrent_requests : int
+        Maximum number of batch requests in flight at once.
 
     Returns
     -------
@@ -358,7 +561,17 @@ def build_variable_dataframe(
         f"{len(batches)} batches (batch_size={batch_size})[/blue]"
     )
 
-    batch_dataframes: list[pd.DataFrame] = []
+    batch_kwargs = dict(
+        variable=variable,
+        model=model,
+        scenario=scenario,
+        counties=counties,
+        collection_id=collection_id,
+        scale=scale,
+    )
+    batch_results: dict[int, pd.DataFrame] = {}
+    # Batches that failed fast on an open circuit get one more pass below
+    skipped_batches: list[int] = []
 
     with Progress(
         SpinnerColumn(),
@@ -371,30 +584,59 @@ def build_variable_dataframe(
             f"GEE {variable} ({model}/{scenario})", total=len(batches)
         )
 
-        for batch_years in batches:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrent_requests, len(batches)))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    process_variable_year_batch, years=batch_years, **batch_kwargs
+                ): batch_index
+                for batch_index, batch_years in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                batch_index = futures[future]
+                batch_years = batches[batch_index]
+                try:
+                    batch_dataframe = future.result()
+                    if not batch_dataframe.empty:
+                        batch_results[batch_index] = batch_dataframe
+                        console.print(
+                            f"  [cyan]Batch {batch_years[0]}-{batch_years[-1]}: "
+                            f"{len(batch_dataframe)} rows[/cyan]"
+                        )
+                except CircuitOpenError:
+                    skipped_batches.append(batch_index)
+                except Exception as error:
+                    console.print(
+                        f"  [red]Batch {batch_years[0]}-{batch_years[-1]} failed: "
+                        f"{error}[/red]"
+                    )
+                progress.advance(task)
+
+    if skipped_batches:
+        wait_seconds = GEE_CIRCUIT_BREAKER.seconds_until_probe()
+        console.print(
+            f"[yellow]{len(skipped_batches)} {variable} batches skipped while the "
+            f"GEE circuit was open; retrying them once in {wait_seconds:.0f}s[/yellow]"
+        )
+        time.sleep(wait_seconds)
+        for batch_index in sorted(skipped_batches):
+            batch_years = batches[batch_index]
             try:
                 batch_dataframe = process_variable_year_batch(
-                    variable=variable,
-                    years=batch_years,
-                    model=model,
-                    scenario=scenario,
-                    counties=counties,
-                    collection_id=collection_id,
-                    scale=scale,
+                    years=batch_years, **batch_kwargs
                 )
-                if not batch_dataframe.empty:
-                    batch_dataframes.append(batch_dataframe)
-                    console.print(
-                        f"  [cyan]Batch {batch_years[0]}-{batch_years[-1]}: "
-                        f"{len(batch_dataframe)} rows[/cyan]"
-                    )
             except Exception as error:
                 console.print(
                     f"  [red]Batch {batch_years[0]}-{batch_years[-1]} failed: "
                     f"{error}[/red]"
                 )
-            progress.advance(task)
+                continue
+            if not batch_dataframe.empty:
+                batch_results[batch_index] = batch_dataframe
 
+    # Reassemble in year order regardless of completion order
+    batch_dataframes = [batch_results[index] for index in sorted(batch_results)]
     if not batch_dataframes:
         console.print(f"[yellow]No data returned for {variable}[/yellow]")
         return pd.DataFrame(columns=VARIABLE_OUTPUT_COLUMNS[variable])
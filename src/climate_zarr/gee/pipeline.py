@@ -19,7 +19,10 @@ from rich.console import Console
 from climate_zarr.gee.client import initialize_gee, get_county_features
 from climate_zarr.gee.config import GEEPipelineConfig
 from climate_zarr.gee.extract import (
+    GEE_CIRCUIT_BREAKER,
+    auto_batch_size,
     build_feature_collection,
+    count_features,
     build_variable_dataframe,
     postprocess_variable_dataframe,
 )
@@ -40,7 +43,9 @@ def run_gee_pipeline(config: GEEPipelineConfig) -> PipelineResult:
     """Run the full GEE-based climate pipeline.
 
     Dispatches to sequential or batch export mode based on
-    ``config.use_batch_export``.
+    ``config.use_batch_export``. The shared GEE circuit breaker is reset
+    first, so failures from an earlier run in the same process don't block
+    this one.
 
     Parameters
     ----------
@@ -52,6 +57,7 @@ def run_gee_pipeline(config: GEEPipelineConfig) -> PipelineResult:
     PipelineResult
         Same result type as ``climate_zarr.pipeline.run_pipeline``.
     """
+    GEE_CIRCUIT_BREAKER.reset()
     if config.use_batch_export:
         return run_gee_pipeline_batch(config)
     return _run_gee_pipeline_sequential(config)
@@ -90,7 +96,11 @@ def _run_gee_pipeline_sequential(config: GEEPipelineConfig) -> PipelineResult:
 
     # Stage 1: Initialize GEE
     console.print("[bold cyan]Stage 1: Initialize GEE[/bold cyan]")
-    initialize_gee(gee_config.project_id)
+    initialize_gee(
+        gee_config.project_id,
+        high_volume=gee_config.high_volume_endpoint,
+        max_connections=max(10, gee_config.max_concurrent_requests),
+    )
 
     # Stage 2: Load county features
     console.print("[bold cyan]Stage 2: Load county features[/bold cyan]")
@@ -99,10 +109,20 @@ def _run_gee_pipeline_sequential(config: GEEPipelineConfig) -> PipelineResult:
         county_asset=gee_config.county_asset,
     )
 
+    batch_size = gee_config.batch_size
+    if batch_size is None:
+        try:
+            batch_size = auto_batch_size(count_features(counties))
+        except RuntimeError as error:
+            # One year per call fits the getInfo() limit for any region
+            batch_size = 1
+            console.print(f"  [yellow]Could not count counties: {error}[/yellow]")
+        console.print(f"  [dim]Years per getInfo() call: {batch_size}[/dim]")
+
     # Stage 3: Extract per-variable DataFrames
     console.print("[bold cyan]Stage 3: Extract climate variables from GEE[/bold cyan]")
 
-    per_variable_dataframes: Dict[str, pd.DataFrame] = {}
+    per_variable_chunks: Dict[str, List[pd.DataFrame]] = {}
     variables_processed: List[str] = []
     variables_skipped: List[str] = []
 
@@ -123,7 +143,8 @@ def _run_gee_pipeline_sequential(config: GEEPipelineConfig) -> PipelineResult:
                         counties=counties,
                         collection_id=gee_config.collection_id,
                         scale=gee_config.scale,
-                        batch_size=gee_config.batch_size,
+                        batch_size=batch_size,
+                        max_concurrent_requests=gee_config.max_concurrent_requests,
                     )
 
                     if variable_dataframe.empty:
@@ -137,15 +158,11 @@ def _run_gee_pipeline_sequential(config: GEEPipelineConfig) -> PipelineResult:
                     if len(config.models) > 1:
                         variable_dataframe["model"] = model_name
 
-                    # Accumulate: if a variable key already exists (from a
-                    # prior model), concatenate the DataFrames.
-                    if variable_name in per_variable_dataframes:
-                        per_variable_dataframes[variable_name] = pd.concat(
-                            [per_variable_dataframes[variable_name], variable_dataframe],
-                            ignore_index=True,
-                        )
-                    else:
-                        per_variable_dataframes[variable_name] = variable_dataframe
+                    # Collect per-model chunks and concatenate once after the
+                    # loop; growing a frame per model copies it every time.
+                    per_variable_chunks.setdefault(variable_name, []).append(
+                        variable_dataframe
+                    )
 
                     variables_processed.append(variable_name)
                     console.print(
@@ -158,6 +175,12 @@ def _run_gee_pipeline_sequential(config: GEEPipelineConfig) -> PipelineResult:
                     )
                     variables_skipped.append(variable_name)
 
+    per_variable_dataframes: Dict[str, pd.DataFrame] = {
+        variable_name: chunks[0] if len(chunks) == 1
+        else pd.concat(chunks, ignore_index=True)
+        for variable_name, chunks in per_variable_chunks.items()
+    }
+
     # Stage 4: Merge & Transform
     console.print("[bold cyan]Stage 4: Merge & transform[/bold cyan]")
 
@@ -4,6 +4,13 @@ Provides a single ``run_pipeline()`` function that orchestrates the full
 climate data pipeline without interactive prompts.
 """
 
+import multiprocessing
+import os
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
@@ -12,29 +19,10 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from rich.console import Console
 
 from climate_zarr.climate_config import ClimateConfig, get_config
-from climate_zarr.county_processor import ModernCountyProcessor
-from climate_zarr.stack_nc_to_zarr import (
-    generate_hierarchical_zarr_path,
-    stack_netcdf_to_zarr_hierarchical,
-)
-from climate_zarr.transform import merge_climate_dataframes
-
-try:
-    from climate_zarr.utils.file_discovery import discover_netcdf_files
-
-    HAS_FILE_DISCOVERY = True
-except ImportError:
-    HAS_FILE_DISCOVERY = False
+from climate_zarr.climate_config import DEFAULT_THRESHOLDS as DEFAULT_THRESHOLDS
 
 console = Console()
 
-DEFAULT_THRESHOLDS: Dict[str, float] = {
-    "pr": 25.4,
-    "tas": 0.0,
-    "tasmax": 35.0,
-    "tasmin": 0.0,
-}
-
 SUPPORTED_VARIABLES = ("pr", "tas", "tasmax", "tasmin")
 
 
@@ -69,20 +57,36 @@ class PipelineConfig(BaseModel):
     )
     output_file: Optional[Path] = Field(
         default=None,
-        description="Final CSV path. Defaults to {output_dir}/transformed/{region}_{scenario}_climate_stats.csv.",
+        description=(
+            "Final output path; a .parquet suffix writes zstd Parquet instead of CSV. "
+            "Defaults to {output_dir}/transformed/{region}_{scenario}_climate_stats.csv."
+        ),
     )
     n_workers: int = Field(default=4, ge=1, description="Number of workers.")
+    parallel_conversion: bool = Field(
+        default=True,
+        description="Convert variables to Zarr concurrently.",
+    )
+    parallel_stats: bool = Field(
+        default=False,
+        description=(
+            "Compute per-variable county statistics concurrently, splitting "
+            "n_workers across the worker processes."
+        ),
+    )
 
     @field_validator("region")
     @classmethod
     def validate_region(cls, region_value: str) -> str:
-        config = get_config()
-        if region_value.lower() not in config.regions:
-            available_regions = list(config.regions.keys())
+        # ``regions`` is a dict, so membership is already a hash lookup; the
+        # sorted name list is only built for the error message.
+        regions = get_config().regions
+        region_key = region_value.lower()
+        if region_key not in regions:
             raise ValueError(
-                f"Unknown region '{region_value}'. Available: {available_regions}"
+                f"Unknown region '{region_value}'. Available: {sorted(regions)}"
             )
-        return region_value.lower()
+        return region_key
 
     @field_validator("variables", mode="before")
     @classmethod
@@ -108,10 +112,11 @@ class PipelineConfig(BaseModel):
                 / "transformed"
                 / f"{self.region}_{self.scenario}_climate_stats.csv"
             )
+        default_thresholds = get_config().variable_thresholds
         if self.thresholds is None:
-            self.thresholds = dict(DEFAULT_THRESHOLDS)
+            self.thresholds = dict(default_thresholds)
         else:
-            merged_thresholds = dict(DEFAULT_THRESHOLDS)
+            merged_thresholds = dict(default_thresholds)
             merged_thresholds.update(self.thresholds)
             self.thresholds = merged_thresholds
         return self
@@ -135,6 +140,68 @@ class PipelineResult(BaseModel):
     zarr_paths: Dict[str, Path] = Field(default_factory=dict)
 
 
+def _discover_variable_files(nc_search_directory: Path) -> List[Path]:
+    """List the NetCDF files for one variable directory."""
+    try:
+        from climate_zarr.utils.file_discovery import discover_netcdf_files
+    except ImportError:
+        discover_netcdf_files = None
+
+    if discover_netcdf_files is not None:
+        return discover_netcdf_files(
+            directory=nc_search_directory,
+            pattern="*.nc",
+            validate=True,
+            verbose=False,
+            fail_on_invalid=False,
+            # Magic-byte checks run concurrently; opening each file would
+            # serialize on the NetCDF open lock
+            header_only=True,
+        )
+
+    if not nc_search_directory.exists():
+        return []
+    with os.scandir(nc_search_directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".nc") and not entry.name.startswith("._")
+        )
+
+
+def _init_worker_process() -> None:
+    """Keep Blosc single-threaded inside pipeline worker processes.
+
+    Each worker would otherwise start its own pool of Blosc threads, and N
+    processes with M threads each oversubscribe the CPUs.
+    """
+    from numcodecs import blosc
+
+    blosc.use_threads = False
+    blosc.set_nthreads(1)
+
+
+def _process_variable_stats(
+    zarr_path: Path,
+    gdf,
+    scenario: str,
+    variable: str,
+    threshold: float,
+    n_workers: int,
+) -> pd.DataFrame:
+    """Compute one variable's county statistics in a worker process."""
+    from climate_zarr.county_processor import ModernCountyProcessor
+
+    with ModernCountyProcessor(n_workers=n_workers) as processor:
+        return processor.process_zarr_data(
+            zarr_path=zarr_path,
+            gdf=gdf,
+            scenario=scenario,
+            variable=variable,
+            threshold=threshold,
+        )
+
+
 def run_pipeline(
     nc_dir: Optional[Path] = None,
     shapefile: Optional[Path] = None,
@@ -147,6 +214,8 @@ def run_pipeline(
     output_dir: Path = Path("climate_outputs"),
     output_file: Optional[Path] = None,
     n_workers: int = 4,
+    parallel_conversion: bool = True,
+    parallel_stats: bool = False,
 ) -> PipelineResult:
     """Run the full climate data pipeline.
 
@@ -173,12 +242,30 @@ def run_pipeline(
         Explicit CSV output path.
     n_workers : int
         Number of parallel workers.
+    parallel_conversion : bool
+        Convert variables to Zarr concurrently (up to four at a time).
+    parallel_stats : bool
+        Compute county statistics for several variables concurrently, one
+        worker process per variable (at most ``n_workers``, up to four).
+        The ``n_workers`` budget is divided between the processes. Each
+        process sizes its memory target independently, so peak memory grows
+        with the number of concurrent variables.
 
     Returns
     -------
     PipelineResult
         Contains merged DataFrame, per-variable DataFrames, and metadata.
     """
+    # Heavy dependencies (xarray, zarr, geopandas) are imported only once a
+    # run starts, so building or validating a PipelineConfig stays cheap.
+    from climate_zarr.county_processor import ModernCountyProcessor
+    from climate_zarr.stack_nc_to_zarr import (
+        generate_hierarchical_zarr_path,
+        stack_netcdf_to_zarr_hierarchical,
+    )
+    from climate_zarr.transform import merge_climate_dataframes
+    from climate_zarr.utils.output_utils import write_csv, write_parquet
+
     # Build and validate configuration upfront.
     pipeline_config = PipelineConfig(
         nc_dir=nc_dir,
@@ -191,6 +278,8 @@ def run_pipeline(
         output_dir=output_dir,
         output_file=output_file,
         n_workers=n_workers,
+        parallel_conversion=parallel_conversion,
+        parallel_stats=parallel_stats,
     )
 
     console.print(f"[bold]Pipeline: region={pipeline_config.region}, "
@@ -207,27 +296,28 @@ def run_pipeline(
     # ------------------------------------------------------------------
     if pipeline_config.nc_dir is not None:
         console.print("[bold cyan]Stage 1: NetCDF -> Zarr conversion[/bold cyan]")
-        for variable_name in pipeline_config.variables:
-            console.print(f"[cyan]Discovering NetCDF files for {variable_name}...[/cyan]")
-
-            if HAS_FILE_DISCOVERY:
-                nc_files = discover_netcdf_files(
-                    directory=pipeline_config.nc_dir / variable_name,
-                    pattern="*.nc",
-                    validate=True,
-                    verbose=False,
-                    fail_on_invalid=False,
+        console.print(
+            f"[cyan]Discovering NetCDF files for {', '.join(pipeline_config.variables)}...[/cyan]"
+        )
+        # Probe every variable directory concurrently; listing and header
+        # checks are latency-bound on network mounts
+        variable_dirs = [
+            pipeline_config.nc_dir / variable_name
+            for variable_name in pipeline_config.variables
+        ]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(variable_dirs)))
+        ) as executor:
+            discovered_files = dict(
+                zip(
+                    pipeline_config.variables,
+                    executor.map(_discover_variable_files, variable_dirs),
                 )
-            else:
-                nc_search_directory = pipeline_config.nc_dir / variable_name
-                if nc_search_directory.exists():
-                    nc_files = sorted(
-                        f
-                        for f in nc_search_directory.glob("*.nc")
-                        if not f.name.startswith("._")
-                    )
-                else:
-                    nc_files = []
+            )
+
+        files_by_variable: Dict[str, List[Path]] = {}
+        for variable_name in pipeline_config.variables:
+            nc_files = discovered_files[variable_name]
 
             if not nc_files:
                 console.print(
@@ -235,15 +325,43 @@ def run_pipeline(
                 )
                 continue
 
-            zarr_output_path = stack_netcdf_to_zarr_hierarchical(
-                nc_files=nc_files,
-                variable=variable_name,
-                region=pipeline_config.region,
-                scenario=pipeline_config.scenario,
-                base_zarr_dir=pipeline_config.zarr_dir,
+            files_by_variable[variable_name] = nc_files
+
+        # Each variable writes its own store, so conversions can run side by
+        # side. Worker processes rather than threads: the netCDF-C library is
+        # not thread-safe across concurrently open files. Spawned rather than
+        # forked so no lock held by a parent thread is inherited.
+        parallel = pipeline_config.parallel_conversion and len(files_by_variable) > 1
+
+        if parallel:
+            executor = ProcessPoolExecutor(
+                max_workers=min(len(files_by_variable), 4),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
             )
-            zarr_paths[variable_name] = zarr_output_path
-            console.print(f"[green]Converted {variable_name}: {zarr_output_path}[/green]")
+        else:
+            executor = ThreadPoolExecutor(max_workers=1)
+
+        with executor:
+            future_to_variable = {
+                executor.submit(
+                    stack_netcdf_to_zarr_hierarchical,
+                    nc_files=variable_files,
+                    variable=variable_name,
+                    region=pipeline_config.region,
+                    scenario=pipeline_config.scenario,
+                    base_zarr_dir=pipeline_config.zarr_dir,
+                    show_progress=not parallel,
+                ): variable_name
+                for variable_name, variable_files in files_by_variable.items()
+            }
+            for future in as_completed(future_to_variable):
+                variable_name = future_to_variable[future]
+                zarr_output_path = future.result()
+                zarr_paths[variable_name] = zarr_output_path
+                console.print(
+                    f"[green]Converted {variable_name}: {zarr_output_path}[/green]"
+                )
     else:
         console.print("[bold cyan]Stage 1: Skipped (no nc_dir provided)[/bold cyan]")
 
@@ -268,6 +386,7 @@ def run_pipeline(
             f"[green]Loaded shapefile: {len(county_geodataframe)} counties[/green]"
         )
 
+        stats_jobs: Dict[str, tuple] = {}
         for variable_name in pipeline_config.variables:
             variable_zarr_path = zarr_paths[variable_name]
 
@@ -279,21 +398,75 @@ def run_pipeline(
                 variables_skipped.append(variable_name)
                 continue
 
-            threshold_value = pipeline_config.thresholds.get(
-                variable_name, DEFAULT_THRESHOLDS.get(variable_name, 0.0)
-            )
-            console.print(
-                f"[cyan]Processing {variable_name} "
-                f"(threshold={threshold_value})...[/cyan]"
-            )
+            threshold_value = pipeline_config.thresholds.get(variable_name, 0.0)
+            stats_jobs[variable_name] = (variable_zarr_path, threshold_value)
+
+        # Variables read separate stores and have their own processors, so
+        # they can be aggregated side by side. Worker processes keep each
+        # variable's progress display and GIL-bound county loop separate.
+        # The n_workers budget is shared out so the processes' own thread
+        # pools don't multiply it. Workers are spawned, not forked: the
+        # parent already runs zarr/dask threads, and a forked child can
+        # deadlock on a lock one of them held.
+        stats_processes = min(len(stats_jobs), pipeline_config.n_workers, 4)
+        if pipeline_config.parallel_stats and stats_processes > 1:
+            workers_per_process = max(1, pipeline_config.n_workers // stats_processes)
+            for variable_name, (_, threshold_value) in stats_jobs.items():
+                console.print(
+                    f"[cyan]Processing {variable_name} "
+                    f"(threshold={threshold_value})...[/cyan]"
+                )
+            with ProcessPoolExecutor(
+                max_workers=stats_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
+            ) as executor:
+                future_to_variable = {
+                    executor.submit(
+                        _process_variable_stats,
+                        variable_zarr_path,
+                        county_geodataframe,
+                        pipeline_config.scenario,
+                        variable_name,
+                        threshold_value,
+                        workers_per_process,
+                    ): variable_name
+                    for variable_name, (
+                        variable_zarr_path,
+                        threshold_value,
+                    ) in stats_jobs.items()
+                }
+                # Report each variable as soon as its worker finishes so a
+                # slow or hung variable is visible while the others complete
+                completed_results = {}
+                for future in as_completed(future_to_variable):
+                    variable_name = future_to_variable[future]
+                    completed_results[variable_name] = future.result()
+                    console.print(
+                        f"[cyan]Finished {variable_name} "
+                        f"({len(completed_results)}/{len(future_to_variable)} variables)[/cyan]"
+                    )
+                # Keep the configured variable order for merging
+                variable_results = {
+                    variable_name: completed_results[variable_name]
+                    for variable_name in stats_jobs
+                }
+        else:
+            variable_results = {}
+            for variable_name, (variable_zarr_path, threshold_value) in stats_jobs.items():
+                console.print(
+                    f"[cyan]Processing {variable_name} "
+                    f"(threshold={threshold_value})...[/cyan]"
+                )
+                variable_results[variable_name] = processor.process_zarr_data(
+                    zarr_path=variable_zarr_path,
+                    gdf=county_geodataframe,
+                    scenario=pipeline_config.scenario,
+                    variable=variable_name,
+                    threshold=threshold_value,
+                )
 
-            variable_dataframe = processor.process_zarr_data(
-                zarr_path=variable_zarr_path,
-                gdf=county_geodataframe,
-                scenario=pipeline_config.scenario,
-                variable=variable_name,
-                threshold=threshold_value,
-            )
+        for variable_name, variable_dataframe in variable_results.items():
             per_variable_dataframes[variable_name] = variable_dataframe
             variables_processed.append(variable_name)
             console.print(
@@ -317,17 +490,90 @@ def run_pipeline(
 
     merged_dataframe = merge_climate_dataframes(per_variable_dataframes)
 
-    # Save to CSV.
-    output_csv_path = pipeline_config.output_file
-    output_csv_path.parent.mkdir(parents=True, exist_ok=True)
-    merged_dataframe.to_csv(output_csv_path, index=False)
-    console.print(f"[green]Saved: {output_csv_path} ({len(merged_dataframe)} rows)[/green]")
+    # Save through the shared writers (PyArrow CSV, or zstd Parquet).
+    output_path = pipeline_config.output_file
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix == ".parquet":
+        write_parquet(merged_dataframe, output_path)
+    else:
+        write_csv(merged_dataframe, output_path)
+    console.print(f"[green]Saved: {output_path} ({len(merged_dataframe)} rows)[/green]")
 
     return PipelineResult(
         merged_df=merged_dataframe,
-        output_path=output_csv_path,
+        output_path=output_path,
         per_variable=per_variable_dataframes,
         variables_processed=variables_processed,
         variables_skipped=variables_skipped,
         zarr_paths=zarr_paths,
     )
+
+
+def main():
+    """Command-line entry point: ``python -m climate_zarr.pipeline``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Run the NetCDF -> Zarr -> county statistics pipeline"
+    )
+    parser.add_argument(
+        "--nc-dir",
+        type=Path,
+        help="NetCDF source directory with one subdirectory per variable "
+        "(omit to use existing Zarr stores)",
+    )
+    parser.add_argument("--shapefile", type=Path, help="County shapefile path")
+    parser.add_argument(
+        "--region", type=str, default="conus", help="Geographic region (default: conus)"
+    )
+    parser.add_argument(
+        "--variables",
+        nargs="+",
+        default=list(SUPPORTED_VARIABLES),
+        choices=SUPPORTED_VARIABLES,
+        help="Climate variables to process (default: all)",
+    )
+    parser.add_argument(
+        "--scenario", type=str, default="ssp370", help="Climate scenario (default: ssp370)"
+    )
+    parser.add_argument("--zarr-dir", type=Path, help="Zarr store base directory")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("climate_outputs"),
+        help="Base output directory (default: climate_outputs)",
+    )
+    parser.add_argument("-o", "--output-file", type=Path, help="Final output path")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=4, help="Number of workers (default: 4)"
+    )
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Convert variables to Zarr one at a time instead of in worker processes",
+    )
+    parser.add_argument(
+        "--parallel-stats",
+        action="store_true",
+        help="Compute county statistics for several variables concurrently",
+    )
+
+    args = parser.parse_args()
+
+    run_pipeline(
+        nc_dir=args.nc_dir,
+        shapefile=args.shapefile,
+        region=args.region,
+        variables=args.variables,
+        scenario=args.scenario,
+        zarr_dir=args.zarr_dir,
+        output_dir=args.output_dir,
+        output_file=args.output_file,
+        n_workers=args.workers,
+        parallel_conversion=not args.no_parallel,
+        parallel_stats=args.parallel_stats,
+    )
+
+
+if __name__ == "__main__":
+    main()
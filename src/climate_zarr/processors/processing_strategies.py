@@ -10,8 +10,14 @@ import geopandas as gpd
 import xarray as xr
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-
-from ..utils.spatial_utils import get_time_information, clip_county_data
+from rioxarray.exceptions import DimensionError
+
+from ..utils.spatial_utils import (
+    build_county_cell_index,
+    clip_county_data,
+    county_spatial_means,
+    get_time_information,
+)
 from ..utils.data_utils import calculate_statistics
 
 console = Console()
@@ -689,6 +695,7 @@ class VectorizedStrategy(ProcessingStrategy):
 
     This strategy provides:
     - Precise geometric clipping with proper CRS handling
+    - One rasterization per county, then grid-wide per-year county means
     - Memory-efficient sequential processing
     - Robust error handling for complex county boundaries
     - Optimal handling of coastal counties and edge cases
@@ -718,13 +725,12 @@ class VectorizedStrategy(ProcessingStrategy):
         """
 
         console.print(
-            "[yellow]Processing counties with optimized rioxarray clipping...[/yellow]"
+            "[yellow]Processing counties with a precomputed county cell index...[/yellow]"
         )
 
         # Validate and prepare spatial data
         self._validate_spatial_data(data, gdf)
 
-        results = []
         years, unique_years = get_time_information(data)
 
         console.print(
@@ -733,6 +739,46 @@ class VectorizedStrategy(ProcessingStrategy):
         console.print(f"[cyan]Data shape: {data.shape} (time, lat, lon)[/cyan]")
         console.print(f"[cyan]Data CRS: {data.rio.crs or 'EPSG:4326 (assumed)'}[/cyan]")
 
+        # Rasterize every county once and average the whole grid per year;
+        # fall back to per-county clipping only when the grid has no usable
+        # spatial dimensions. Anything else is a real error and propagates.
+        try:
+            cell_index, offsets = build_county_cell_index(data, gdf)
+        except DimensionError as e:
+            console.print(
+                f"[yellow]County cell index unavailable ({str(e)}), clipping counties individually[/yellow]"
+            )
+            results = self._process_by_clipping(
+                data, gdf, years, unique_years, variable, scenario, threshold
+            )
+        else:
+            results = self._process_by_cell_index(
+                data,
+                gdf,
+                cell_index,
+                offsets,
+                years,
+                unique_years,
+                variable,
+                scenario,
+                threshold,
+            )
+
+        return pd.DataFrame(results)
+
+    def _process_by_clipping(
+        self,
+        data: xr.DataArray,
+        gdf: gpd.GeoDataFrame,
+        years: np.ndarray,
+        unique_years: np.ndarray,
+        variable: str,
+        scenario: str,
+        threshold: float,
+    ) -> List[Dict]:
+        """Clip and process each county in turn."""
+        results = []
+
         # Track processing statistics
         successful_counties = 0
         failed_counties = 0
@@ -784,7 +830,86 @@ class VectorizedStrategy(ProcessingStrategy):
             f"[green]Processing complete: {successful_counties} successful, {empty_clips} empty clips, {failed_counties} failed[/green]"
         )
 
-        return pd.DataFrame(results)
+        return results
+
+    def _process_by_cell_index(
+        self,
+        data: xr.DataArray,
+        gdf: gpd.GeoDataFrame,
+        cell_index: np.ndarray,
+        offsets: np.ndarray,
+        years: np.ndarray,
+        unique_years: np.ndarray,
+        variable: str,
+        scenario: str,
+        threshold: float,
+    ) -> List[Dict]:
+        """Process all counties together, one year of the grid at a time.
+
+        Daily county means come from ``county_spatial_means`` over the
+        precomputed cell index, so each year is read once for every county.
+        Results keep the county-then-year order of ``_process_by_clipping``.
+        """
+        county_infos = [
+            {
+                "county_id": county["county_id"],
+                "county_name": county["county_name"],
+                "state": county["state"],
+            }
+            for _, county in gdf.iterrows()
+        ]
+        has_cells = offsets[1:] > offsets[:-1]
+        county_results: List[List[Dict]] = [[] for _ in county_infos]
+
+        for county_idx in np.flatnonzero(~has_cells):
+            county_info = county_infos[county_idx]
+            console.print(
+                f"[yellow]Warning: No data found for {county_info['county_name']}, {county_info['state']}[/yellow]"
+            )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Processing years...", total=len(unique_years))
+
+            for year in unique_years:
+                year_values = np.asarray(data.isel(time=years == year).values)
+                county_daily_means = county_spatial_means(
+                    year_values, cell_index, offsets
+                )
+
+                for county_idx in np.flatnonzero(has_cells):
+                    county_info = county_infos[county_idx]
+                    daily_means = county_daily_means[county_idx]
+                    try:
+                        if np.any(np.isnan(daily_means)):
+                            daily_means = daily_means[~np.isnan(daily_means)]
+                            if len(daily_means) == 0:
+                                continue
+
+                        stats = calculate_statistics(
+                            daily_means, variable, threshold, year, scenario, county_info
+                        )
+
+                        if stats:
+                            county_results[county_idx].append(stats)
+
+                    except Exception as e:
+                        console.print(
+                            f"[red]Error processing year {year} for {county_info['county_name']}: {str(e)}[/red]"
+                        )
+
+                progress.advance(task)
+
+        console.print(
+            f"[green]Processing complete: {int(has_cells.sum())} counties with data, {int((~has_cells).sum())} empty[/green]"
+        )
+
+        return [stats for per_county in county_results for stats in per_county]
 
     def _validate_spatial_data(self, data: xr.DataArray, gdf: gpd.GeoDataFrame) -> None:
         """Validate spatial data consistency and CRS alignment."""
@@ -2,8 +2,10 @@
 """Stack multiple NetCDF files into a single Zarr store."""
 
 import argparse
+import math
 from pathlib import Path
 from typing import List, Optional
+import numpy as np
 import xarray as xr
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -144,25 +146,190 @@ def clip_to_region(
     return ds_clipped
 
 
+# Uncompressed bytes per chunk targeted by default chunking; 8-16 MB suits
+# both object-store range reads and Dask task sizes
+CHUNK_TARGET_BYTES = 12 * 1024 * 1024
+
+
+def default_chunks(
+    ds: xr.Dataset, time_dim: str = "time", target_bytes: int = CHUNK_TARGET_BYTES
+) -> dict:
+    """Pick chunk sizes of roughly ``target_bytes`` uncompressed per chunk.
+
+    Used for stores that are not clipped to a region. Chunks span the full
+    spatial extent and as many time steps as fit. If a single time step of
+    the largest variable exceeds the target, its other dimensions are split
+    evenly instead.
+    """
+    chunks = {dim: size for dim, size in ds.sizes.items() if dim != time_dim}
+    if not ds.data_vars:
+        return chunks
+
+    # Size the chunks for the variable with the largest per-timestep slice
+    def slice_bytes(var):
+        data = ds[var]
+        return data.dtype.itemsize * math.prod(
+            data.sizes[dim] for dim in data.dims if dim != time_dim
+        )
+
+    largest = max(ds.data_vars, key=slice_bytes)
+    largest_bytes = slice_bytes(largest)
+
+    if largest_bytes <= target_bytes:
+        if time_dim in ds.sizes:
+            chunks[time_dim] = min(ds.sizes[time_dim], target_bytes // largest_bytes)
+    else:
+        if time_dim in ds.sizes:
+            chunks[time_dim] = 1
+        other_dims = [dim for dim in ds[largest].dims if dim != time_dim]
+        scale = (target_bytes / largest_bytes) ** (1 / len(other_dims))
+        for dim in other_dims:
+            chunks[dim] = max(1, int(ds.sizes[dim] * scale))
+    return chunks
+
+
+def region_chunks(ds: xr.Dataset, region_config, time_dim: str = "time") -> dict:
+    """Chunk a region-clipped dataset into spatial tiles.
+
+    Uses ``ChunkingConfig.for_region`` with the grid spacing and dtype of the
+    data, mapped onto the dataset's own dimension names. Falls back to
+    ``default_chunks`` when latitude/longitude dimensions are not found.
+    """
+    lat_dim = next((d for d in ("lat", "latitude") if d in ds.dims), None)
+    lon_dim = next((d for d in ("lon", "longitude") if d in ds.dims), None)
+    if lat_dim is None or lon_dim is None or ds.sizes[lat_dim] < 2 or not ds.data_vars:
+        return default_chunks(ds, time_dim)
+
+    resolution = abs(float(ds[lat_dim][1] - ds[lat_dim][0]))
+    dtype_bytes = max(ds[var].dtype.itemsize for var in ds.data_vars)
+    tiles = CONFIG.chunking.for_region(region_config, resolution, dtype_bytes)
+
+    chunks = {dim: size for dim, size in ds.sizes.items()}
+    chunks[lat_dim] = min(ds.sizes[lat_dim], tiles["lat"])
+    chunks[lon_dim] = min(ds.sizes[lon_dim], tiles["lon"])
+    if time_dim in ds.sizes:
+        chunks[time_dim] = min(ds.sizes[time_dim], tiles["time"])
+    return chunks
+
+
+# Names accepted for Blosc-Zstd, the default codec
+BLOSC_ZSTD_NAMES = ("default", "blosc:zstd", "zstd")
+
+
+def make_compressor(compression: str = "default", compression_level: int = 3):
+    """Build the numcodecs compressor for a compression name.
+
+    Blosc-Zstd uses bit-shuffling, which exposes the slowly varying exponent
+    bits of float fields to zstd. Returns None for ``"none"`` or an unknown
+    name.
+    """
+    if compression in BLOSC_ZSTD_NAMES:
+        return numcodecs.Blosc(
+            cname="zstd", clevel=compression_level, shuffle=numcodecs.Blosc.BITSHUFFLE
+        )
+    if compression == "zlib":
+        return numcodecs.Zlib(level=compression_level)
+    if compression == "gzip":
+        return numcodecs.GZip(level=compression_level)
+    return None
+
+
+# On-disk dtypes accepted for packing
+PACK_DTYPES = ("none", "float16", "int16", "int8")
+
+# Temperature variables pack with a default quantization step (0.01 K for
+# int16, 1 K for int8); anything else, e.g. ``pr`` in kg m-2 s-1, spans too
+# many orders of magnitude and needs an explicit ``pack_scale``.
+TEMPERATURE_VARIABLES = ("tas", "tasmax", "tasmin")
+DEFAULT_PACK_SCALES = {"int16": 0.01, "int8": 1.0}
+
+
+def _validate_pack_args(pack_dtype: str, pack_scale: Optional[float]) -> None:
+    """Reject unknown pack dtypes and non-positive or non-finite scales."""
+    if pack_dtype not in PACK_DTYPES:
+        raise ValueError(
+            f"Unknown pack dtype '{pack_dtype}'. Supported: {PACK_DTYPES}"
+        )
+    if pack_scale is not None and not (math.isfinite(pack_scale) and pack_scale > 0):
+        raise ValueError(f"pack_scale must be a positive number, got {pack_scale}")
+
+
+def make_pack_encoding(
+    data: xr.DataArray, pack_dtype: str = "none", pack_scale: Optional[float] = None
+) -> dict:
+    """Build the CF packing encoding for one variable.
+
+    ``float16`` is a plain cast and only suits temperatures: ``pr`` in
+    kg m-2 s-1 falls in the float16 subnormal range (below ~6e-5) and loses
+    most of its precision. ``int16``/``int8`` store
+    ``round((value - add_offset) / scale_factor)`` with the dtype minimum
+    reserved for NaN, and xarray decodes back to float on read. Smaller
+    integers leave more zero bits for the bit-shuffled compressor. An
+    explicit ``pack_scale`` applies to every variable in the store, which
+    suits the one-variable hierarchical stores.
+    """
+    _validate_pack_args(pack_dtype, pack_scale)
+    if pack_dtype == "none":
+        return {}
+
+    is_temperature = data.name in TEMPERATURE_VARIABLES
+    if pack_dtype == "float16":
+        if not is_temperature:
+            raise ValueError(
+                f"float16 cannot hold '{data.name}' precisely; use int16 with a pack_scale"
+            )
+        return {"dtype": "float16"}
+
+    if pack_scale is None:
+        if not is_temperature:
+            raise ValueError(
+                f"Packing '{data.name}' as {pack_dtype} requires an explicit pack_scale"
+            )
+        pack_scale = DEFAULT_PACK_SCALES[pack_dtype]
+
+    # Centre Kelvin temperatures on freezing so the int8 range still covers them
+    kelvin = data.attrs.get("units") in ("K", "kelvin")
+    add_offset = 273.15 if is_temperature and kelvin else 0.0
+
+    return {
+        "dtype": pack_dtype,
+        "scale_factor": pack_scale,
+        "add_offset": add_offset,
+        "_FillValue": np.iinfo(pack_dtype).min,
+    }
+
+
 def stack_netcdf_to_zarr(
     nc_files: List[Path],
     zarr_path: Path,
     concat_dim: str = "time",
     chunks: Optional[dict] = None,
     compression: str = "default",
-    compression_level: int = 5,
+    compression_level: int = 3,
     clip_region: Optional[str] = None,
+    show_progress: bool = True,
+    pack_dtype: str = "none",
+    pack_scale: Optional[float] = None,
 ) -> None:
-    """Stack multiple NetCDF files into a single Zarr store."""
+    """Stack multiple NetCDF files into a single Zarr store.
+
+    Set ``show_progress=False`` when running several conversions
+    concurrently; Rich allows only one live progress display at a time.
+    ``pack_dtype`` stores data variables at reduced precision; see
+    ``make_pack_encoding``.
+    """
+    _validate_pack_args(pack_dtype, pack_scale)
 
     console.print(f"[bold]Stacking {len(nc_files)} NetCDF files into Zarr[/bold]")
 
     # Open all datasets
     datasets = []
+    region_config = None
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not show_progress,
     ) as progress:
         task = progress.add_task("Loading NetCDF files...", total=len(nc_files))
 
@@ -206,40 +373,28 @@ def stack_netcdf_to_zarr(
         ds.close()
 
     # Apply chunking
-    if chunks:
-        combined_ds = combined_ds.chunk(chunks)
-    else:
-        # Use larger chunks for better compression with multiple years
-        default_chunks = {}
-        for dim in combined_ds.sizes:
-            if dim == "time":
-                # Chunk by year (365 days) or total size if smaller
-                default_chunks[dim] = min(365, combined_ds.sizes[dim])
-            elif dim in ["lat", "latitude"]:
-                default_chunks[dim] = min(180, combined_ds.sizes[dim])
-            elif dim in ["lon", "longitude"]:
-                default_chunks[dim] = min(360, combined_ds.sizes[dim])
-            else:
-                default_chunks[dim] = min(100, combined_ds.sizes[dim])
-        combined_ds = combined_ds.chunk(default_chunks)
+    if not chunks:
+        # Region stores feed per-county reads, so they get spatial tiles
+        if region_config is not None:
+            chunks = region_chunks(combined_ds, region_config, concat_dim)
+        else:
+            chunks = default_chunks(combined_ds, concat_dim)
+        console.print(f"[dim]Chunking: {chunks}[/dim]")
+    combined_ds = combined_ds.chunk(chunks)
 
     # Set up compression
-    if compression == "default":
-        compressor = numcodecs.Blosc(
-            cname="zstd", clevel=compression_level, shuffle=numcodecs.Blosc.SHUFFLE
-        )
-    elif compression == "zlib":
-        compressor = numcodecs.Zlib(level=compression_level)
-    elif compression == "gzip":
-        compressor = numcodecs.GZip(level=compression_level)
-    else:
-        compressor = None
+    compressor = make_compressor(compression, compression_level)
 
-    # Apply compression to all data variables
+    # Apply compression and packing to all data variables
+    if pack_dtype != "none":
+        console.print(f"[dim]Packing: {pack_dtype}[/dim]")
     encoding = {}
-    if compressor:
-        for var in combined_ds.data_vars:
-            encoding[var] = {"compressor": compressor}
+    for var in combined_ds.data_vars:
+        var_encoding = make_pack_encoding(combined_ds[var], pack_dtype, pack_scale)
+        if compressor:
+            var_encoding["compressor"] = compressor
+        if var_encoding:
+            encoding[var] = var_encoding
 
     # Save to Zarr
     console.print("[blue]Writing to Zarr format...[/blue]")
@@ -265,9 +420,12 @@ def stack_netcdf_to_zarr_hierarchical(
     concat_dim: str = "time",
     chunks: Optional[dict] = None,
     compression: str = "default",
-    compression_level: int = 5,
+    compression_level: int = 3,
     include_daily_suffix: bool = None,
     log_conversion: bool = False,
+    show_progress: bool = True,
+    pack_dtype: str = "none",
+    pack_scale: Optional[float] = None,
 ) -> Path:
     """Stack NetCDF files using hierarchical output path structure.
 
@@ -286,6 +444,9 @@ def stack_netcdf_to_zarr_hierarchical(
         compression_level: Compression level (1-9)
         include_daily_suffix: Whether to include '_daily' suffix
         log_conversion: Whether to log conversion details to logs directory
+        show_progress: Whether to show the live file-loading progress display
+        pack_dtype: Reduced-precision on-disk dtype (none, float16, int16, int8)
+        pack_scale: Quantization step for integer packing
 
     Returns:
         Path to the created zarr store
@@ -323,6 +484,9 @@ def stack_netcdf_to_zarr_hierarchical(
         compression=compression,
         compression_level=compression_level,
         clip_region=region,
+        show_progress=show_progress,
+        pack_dtype=pack_dtype,
+        pack_scale=pack_scale,
     )
 
     # Log completion if logging enabled
@@ -368,15 +532,27 @@ def main():
     parser.add_argument(
         "--compression",
         type=str,
-        default="default",
-        choices=["default", "zlib", "gzip", "none"],
-        help="Compression algorithm (default: blosc/zstd)",
+        default="blosc:zstd",
+        choices=[*BLOSC_ZSTD_NAMES, "zlib", "gzip", "none"],
+        help="Compression algorithm (default: blosc:zstd with bit-shuffle)",
     )
     parser.add_argument(
         "--compression-level",
         type=int,
-        default=5,
-        help="Compression level (default: 5)",
+        default=3,
+        help="Compression level (default: 3)",
+    )
+    parser.add_argument(
+        "--pack-dtype",
+        type=str,
+        default="none",
+        choices=PACK_DTYPES,
+        help="Store data at reduced precision (default: none)",
+    )
+    parser.add_argument(
+        "--pack-scale",
+        type=float,
+        help="Quantization step for int16/int8 packing (required for pr)",
     )
     if HAS_CONFIG:
         available_regions = list(CONFIG.regions.keys())
@@ -438,6 +614,8 @@ def main():
         args.compression,
         args.compression_level,
         args.clip,
+        pack_dtype=args.pack_dtype,
+        pack_scale=args.pack_scale,
     )
 
 
@@ -5,26 +5,46 @@ This package provides common utilities for progress tracking,
 spatial operations, and data processing helpers.
 """
 
-from .spatial_utils import (
-    get_time_information,
-    clip_county_data,
-    get_coordinate_arrays,
-    create_county_raster,
-)
-from .data_utils import (
-    calculate_statistics,
-    convert_units,
-    calculate_precipitation_stats,
-    calculate_temperature_stats,
-    calculate_tasmax_stats,
-    calculate_tasmin_stats,
-)
-from .output_utils import (
-    OutputManager,
-    get_output_manager,
-    standardize_output_path,
-    ensure_output_directory,
-)
+import importlib
+
+# Submodules pull in geopandas/rasterio/xarray, so exports are resolved on
+# first attribute access (PEP 562); importing one lightweight submodule such
+# as ``output_utils`` no longer loads the spatial stack.
+_LAZY = {
+    "get_time_information": "climate_zarr.utils.spatial_utils",
+    "clip_county_data": "climate_zarr.utils.spatial_utils",
+    "get_coordinate_arrays": "climate_zarr.utils.spatial_utils",
+    "create_county_raster": "climate_zarr.utils.spatial_utils",
+    "build_county_cell_index": "climate_zarr.utils.spatial_utils",
+    "county_spatial_means": "climate_zarr.utils.spatial_utils",
+    "calculate_statistics": "climate_zarr.utils.data_utils",
+    "convert_units": "climate_zarr.utils.data_utils",
+    "calculate_precipitation_stats": "climate_zarr.utils.data_utils",
+    "calculate_temperature_stats": "climate_zarr.utils.data_utils",
+    "calculate_tasmax_stats": "climate_zarr.utils.data_utils",
+    "calculate_tasmin_stats": "climate_zarr.utils.data_utils",
+    "OutputManager": "climate_zarr.utils.output_utils",
+    "get_output_manager": "climate_zarr.utils.output_utils",
+    "standardize_output_path": "climate_zarr.utils.output_utils",
+    "ensure_output_directory": "climate_zarr.utils.output_utils",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Spatial utilities
@@ -32,6 +52,8 @@ __all__ = [
     "clip_county_data",
     "get_coordinate_arrays",
     "create_county_raster",
+    "build_county_cell_index",
+    "county_spatial_means",
     # Data utilities
     "calculate_statistics",
     "convert_units",
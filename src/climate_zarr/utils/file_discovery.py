@@ -4,14 +4,84 @@ Robust NetCDF file discovery and validation utility.
 Handles common issues with file system artifacts, hidden files, and corrupted data.
 """
 
+import fnmatch
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import xarray as xr
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Leading bytes identifying each NetCDF on-disk format
+NETCDF_MAGIC = {
+    b"\x89HDF\r\n\x1a\n": "netcdf4",
+    b"CDF\x01": "netcdf3_classic",
+    b"CDF\x02": "netcdf3_64bit_offset",
+    b"CDF\x05": "netcdf3_64bit_data",
+}
+MAGIC_READ_SIZE = 8
+
+# Guards NetCDF opens made while validating files
+_NETCDF_OPEN_LOCK = threading.Lock()
+
+# Every signature is distinct in its first four bytes, so one dict lookup
+# replaces a scan over all signatures
+_MAGIC_BY_PREFIX = {magic[:4]: (magic, fmt) for magic, fmt in NETCDF_MAGIC.items()}
+
+
+def _check_magic(header: bytes) -> Optional[str]:
+    """Return the NetCDF format matching a file header, or None."""
+    entry = _MAGIC_BY_PREFIX.get(header[:4])
+    if entry is not None and header.startswith(entry[0]):
+        return entry[1]
+    return None
+
+
+def read_netcdf_format(file_path: Path) -> Optional[str]:
+    """
+    Identify a NetCDF file's format from its leading magic bytes.
+
+    Only the first few bytes are read, so this is far cheaper than opening
+    the file with xarray.
+
+    Returns:
+        Format name (e.g. "netcdf4"), or None if the file is not NetCDF
+        or cannot be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(MAGIC_READ_SIZE)
+    except OSError:
+        return None
+
+    return _check_magic(header)
+
+
+def read_netcdf_formats(
+    file_paths: Iterable[Path], max_workers: int = 32
+) -> Dict[Path, Optional[str]]:
+    """
+    Read NetCDF magic bytes for many files concurrently.
+
+    Header reads are I/O-latency bound, so keeping several in flight
+    through a thread pool scales with the number of workers.
+
+    Returns:
+        Dictionary mapping each path to its format name (or None)
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        formats = executor.map(read_netcdf_format, file_paths)
+        return dict(zip(file_paths, formats))
+
 
 def is_valid_netcdf(file_path: Path, quick_check: bool = True) -> Tuple[bool, Optional[str]]:
     """
@@ -26,8 +96,9 @@ def is_valid_netcdf(file_path: Path, quick_check: bool = True) -> Tuple[bool, Op
         Tuple of (is_valid, error_message)
     """
     try:
-        # Try to open the file with xarray
-        with xr.open_dataset(file_path, engine='netcdf4') as ds:
+        # Try to open the file with xarray (serialized: netCDF-C is not
+        # thread-safe when discovery runs from several threads)
+        with _NETCDF_OPEN_LOCK, xr.open_dataset(file_path, engine='netcdf4') as ds:
             if not quick_check:
                 # Verify it has dimensions and variables
                 if not ds.dims:
@@ -81,12 +152,31 @@ def should_exclude_file(file_path: Path) -> Tuple[bool, Optional[str]]:
     return False, None
 
 
+def scan_directory(directory: Path, pattern: str = "*.nc") -> List[Path]:
+    """
+    List the entries of a directory whose names match a glob pattern.
+
+    Single-component patterns are matched against one ``os.scandir`` listing;
+    nested or recursive patterns fall back to ``Path.glob``.
+
+    Returns:
+        Sorted list of matching paths
+    """
+    if "/" in pattern or "**" in pattern:
+        return sorted(directory.glob(pattern))
+
+    match = re.compile(fnmatch.translate(pattern)).match
+    with os.scandir(directory) as entries:
+        return sorted(Path(entry.path) for entry in entries if match(entry.name))
+
+
 def discover_netcdf_files(
     directory: Path,
     pattern: str = "*.nc",
     validate: bool = True,
     verbose: bool = True,
-    fail_on_invalid: bool = False
+    fail_on_invalid: bool = False,
+    header_only: bool = False
 ) -> List[Path]:
     """
     Discover and validate NetCDF files in a directory.
@@ -97,6 +187,8 @@ def discover_netcdf_files(
         validate: If True, validate each file can be opened by xarray
         verbose: If True, print discovery progress and warnings
         fail_on_invalid: If True, raise exception on invalid files
+        header_only: If True, validate by checking NetCDF magic bytes
+                     (read concurrently) instead of opening each file
 
     Returns:
         List of valid NetCDF file paths
@@ -110,8 +202,8 @@ def discover_netcdf_files(
     if not directory.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
 
-    # Find all matching files
-    all_files = sorted(directory.glob(pattern))
+    # Find all matching files with a single directory listing
+    all_files = scan_directory(directory, pattern)
 
     if verbose:
         console.print(f"[dim]Scanning {directory} for {pattern} files...[/dim]")
@@ -119,8 +211,9 @@ def discover_netcdf_files(
     valid_files = []
     excluded_files = []
     invalid_files = []
+    candidate_files = []
 
-    # Filter and validate files
+    # Filter out system and temporary files
     for file_path in all_files:
         # Check if file should be excluded
         should_exclude, exclude_reason = should_exclude_file(file_path)
@@ -129,10 +222,22 @@ def discover_netcdf_files(
             if verbose:
                 console.print(f"[yellow]⏭️  Skipping {file_path.name}: {exclude_reason}[/yellow]")
             continue
+        candidate_files.append(file_path)
+
+    # Batch the header reads up front when validating by magic bytes
+    header_formats = (
+        read_netcdf_formats(candidate_files) if validate and header_only else {}
+    )
 
+    # Validate remaining files
+    for file_path in candidate_files:
         # Validate file if requested
         if validate:
-            is_valid, error_msg = is_valid_netcdf(file_path, quick_check=True)
+            if header_only:
+                is_valid = header_formats[file_path] is not None
+                error_msg = None if is_valid else "Not a valid NetCDF file"
+            else:
+                is_valid, error_msg = is_valid_netcdf(file_path, quick_check=True)
             if is_valid:
                 valid_files.append(file_path)
             else:
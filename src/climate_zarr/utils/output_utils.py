@@ -9,9 +9,82 @@ from datetime import datetime
 
 from climate_zarr.climate_config import get_config, ClimateConfig
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
 
+def write_csv(data: Any, output_path: Path) -> None:
+    """Write a DataFrame or Arrow table to CSV, preferring PyArrow's C++ writer."""
+    if HAS_PYARROW:
+        table = (
+            data
+            if isinstance(data, pa.Table)
+            else pa.Table.from_pandas(data, preserve_index=False)
+        )
+        pacsv.write_csv(
+            table,
+            str(output_path),
+            write_options=pacsv.WriteOptions(include_header=True),
+        )
+    else:
+        data.to_csv(output_path, index=False)
+
+
+def write_parquet(data: Any, output_path: Path, compression_level: int = 3) -> None:
+    """Write a DataFrame or Arrow table to Zstandard-compressed Parquet."""
+    if HAS_PYARROW and isinstance(data, pa.Table):
+        pq.write_table(
+            data,
+            str(output_path),
+            compression="zstd",
+            compression_level=compression_level,
+        )
+        return
+    data.to_parquet(
+        output_path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=compression_level,
+        index=False,
+    )
+
+
+# County statistics tables are stored as (county_id, year) arrays
+ZARR_TABLE_DIMS = ("county_id", "year")
+
+
+def write_zarr(data: Any, output_path: Path, compression_level: int = 3) -> None:
+    """Write a Dataset (or DataFrame) to Zarr with bit-shuffled Blosc-Zstd.
+
+    Uses the same codec as the daily stores written by ``stack_nc_to_zarr``.
+    DataFrames with ``county_id`` and ``year`` columns are laid out along
+    those dimensions (with a leading ``model`` dimension for multi-model
+    output) instead of a bare row index.
+    """
+    import numcodecs
+
+    if not hasattr(data, "data_vars"):
+        if set(ZARR_TABLE_DIMS).issubset(data.columns):
+            index_columns = [
+                column for column in ("model",) if column in data.columns
+            ] + list(ZARR_TABLE_DIMS)
+            data = data.set_index(index_columns)
+        data = data.to_xarray()
+    compressor = numcodecs.Blosc(
+        cname="zstd", clevel=compression_level, shuffle=numcodecs.Blosc.BITSHUFFLE
+    )
+    encoding = {name: {"compressor": compressor} for name in data.data_vars}
+    data.to_zarr(output_path, mode="w", encoding=encoding, zarr_format=2)
+
+
 class OutputManager:
     """Manages standardized output files and directories."""
 
@@ -39,6 +112,7 @@ class OutputManager:
             file_extension=file_extension,
             custom_suffix=custom_suffix,
             threshold=threshold,
+            now=self.config.run_started_at,
         )
 
     def create_output_directory(self, output_path: Path) -> Path:
@@ -62,21 +136,25 @@ class OutputManager:
         # Save main data file
         if save_method == "auto":
             if output_path.suffix == ".csv":
-                data.to_csv(output_path, index=False)
+                write_csv(data, output_path)
+            elif output_path.suffix == ".parquet":
+                write_parquet(data, output_path, self.config.compression.level)
             elif output_path.suffix == ".json":
                 with open(output_path, "w") as f:
                     json.dump(data, f, indent=2, default=str)
             elif output_path.suffix == ".zarr":
-                data.to_zarr(output_path)
+                write_zarr(data, output_path, self.config.compression.level)
             else:
                 raise ValueError(f"Unsupported file extension: {output_path.suffix}")
         elif save_method == "csv":
-            data.to_csv(output_path, index=False)
+            write_csv(data, output_path)
+        elif save_method == "parquet":
+            write_parquet(data, output_path, self.config.compression.level)
         elif save_method == "json":
             with open(output_path, "w") as f:
                 json.dump(data, f, indent=2, default=str)
         elif save_method == "zarr":
-            data.to_zarr(output_path)
+            write_zarr(data, output_path, self.config.compression.level)
 
         logger.info(f"Saved data to: {output_path}")
 
@@ -187,9 +265,23 @@ class OutputManager:
         return old_files
 
 
+_default_manager: Optional[OutputManager] = None
+
+
 def get_output_manager(config: Optional[ClimateConfig] = None) -> OutputManager:
-    """Get a configured output manager instance."""
-    return OutputManager(config)
+    """Get a configured output manager instance.
+
+    Without an explicit ``config`` one manager is shared for the active global
+    configuration, so its output directories are only set up once.
+    """
+    global _default_manager
+    if config is not None:
+        return OutputManager(config)
+
+    active_config = get_config()
+    if _default_manager is None or _default_manager.config is not active_config:
+        _default_manager = OutputManager(active_config)
+    return _default_manager
 
 
 def standardize_output_path(
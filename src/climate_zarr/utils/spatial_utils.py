@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 """Spatial processing utilities for climate data."""
 
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 import geopandas as gpd
 import xarray as xr
-from rasterio.features import rasterize
+from rasterio.features import geometry_mask, rasterize
 from rasterio.transform import from_bounds
 from rich.console import Console
 
@@ -117,4 +119,129 @@ def clip_county_data(
     Returns:
         Clipped DataArray
     """
-    return data.rio.clip([county_geometry], all_touched=all_touched)
+    return _crop_to_bounds(data, county_geometry.bounds).rio.clip(
+        [county_geometry], all_touched=all_touched
+    )
+
+
+def _crop_to_bounds(data: xr.DataArray, bounds: tuple) -> xr.DataArray:
+    """Crop data to the pixels around a bounding box before clipping.
+
+    ``rio.clip`` rasterizes the geometry over the whole grid; cropping first
+    limits that to the county's neighbourhood. The window is padded by one
+    pixel so every touched cell is kept, and the grid alignment is unchanged,
+    so the clip result is identical. Falls back to the full array whenever the
+    crop would be degenerate.
+    """
+    windows = _bounds_window(data, bounds)
+    return data if windows is None else data.isel(windows)
+
+
+def _bounds_window(data: xr.DataArray, bounds: tuple) -> Optional[dict]:
+    """Return the padded ``isel`` window around a bounding box, or None."""
+    minx, miny, maxx, maxy = bounds
+    windows = {}
+    for dim, low, high in (
+        (data.rio.x_dim, minx, maxx),
+        (data.rio.y_dim, miny, maxy),
+    ):
+        coords = data[dim].values
+        if coords.size < 2:
+            return None
+        pad = abs(float(coords[1] - coords[0]))
+        inside = np.flatnonzero((coords >= low - pad) & (coords <= high + pad))
+        if inside.size < 2:
+            return None
+        windows[dim] = slice(int(inside[0]), int(inside[-1]) + 1)
+    return windows
+
+
+def build_county_cell_index(
+    data: xr.DataArray, gdf: gpd.GeoDataFrame, all_touched: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map every county to the flat indices of the grid cells it covers.
+
+    Each county is rasterized once, over its own bounding-box window, with
+    the same mask ``clip_county_data`` applies, so a cell touched by two
+    counties belongs to both. The result is a CSR-style index: the cells of
+    county ``i`` are ``cell_index[offsets[i]:offsets[i + 1]]``.
+
+    Args:
+        data: xarray DataArray with spatial coordinates (time, y, x)
+        gdf: GeoDataFrame with county geometries in the data's CRS
+        all_touched: Whether to include all touched pixels
+
+    Returns:
+        Tuple of (cell_index, offsets) arrays
+    """
+    y_dim, x_dim = data.rio.y_dim, data.rio.x_dim
+    n_x = data.sizes[x_dim]
+
+    county_cells = []
+    for geometry in gdf.geometry:
+        windows = _bounds_window(data, geometry.bounds)
+        window = data if windows is None else data.isel(windows)
+        mask = geometry_mask(
+            [geometry],
+            out_shape=(window.sizes[y_dim], window.sizes[x_dim]),
+            transform=window.rio.transform(recalc=True),
+            invert=True,
+            all_touched=all_touched,
+        )
+        row_start = windows[y_dim].start if windows else 0
+        col_start = windows[x_dim].start if windows else 0
+        rows, cols = np.nonzero(mask)
+        county_cells.append((rows + row_start) * n_x + (cols + col_start))
+
+    offsets = np.zeros(len(county_cells) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(cells) for cells in county_cells])
+    cell_index = (
+        np.concatenate(county_cells).astype(np.int64)
+        if county_cells
+        else np.empty(0, dtype=np.int64)
+    )
+    return cell_index, offsets
+
+
+def county_spatial_means(
+    values: np.ndarray, cell_index: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """Average a (time, y, x) block over every county at once.
+
+    Equivalent to clipping each county and taking ``mean(skipna=True)`` over
+    its cells, but done with one gather and a prefix sum per block instead of
+    one clip per county.
+
+    Args:
+        values: Array of shape (time, y, x)
+        cell_index: Flat cell indices from ``build_county_cell_index``
+        offsets: County offsets from ``build_county_cell_index``
+
+    Returns:
+        Array of shape (n_counties, time); NaN where a county has no valid cells
+    """
+    gathered = values.reshape(values.shape[0], -1)[:, cell_index]
+    valid = ~np.isnan(gathered)
+    has_missing = not valid.all()
+
+    # Prefix sums along the cell axis turn each county segment into one
+    # subtraction; empty segments come out as zero
+    sums = np.zeros((gathered.shape[0], gathered.shape[1] + 1), dtype=np.float64)
+    np.cumsum(
+        np.where(valid, gathered, 0.0) if has_missing else gathered,
+        axis=1,
+        out=sums[:, 1:],
+    )
+    county_sums = sums[:, offsets[1:]] - sums[:, offsets[:-1]]
+
+    # Without missing cells every county's count is just its segment length,
+    # so the second prefix-sum pass is only needed for blocks with NaNs
+    if has_missing:
+        counts = np.zeros(sums.shape, dtype=np.int64)
+        np.cumsum(valid, axis=1, out=counts[:, 1:])
+        county_counts = counts[:, offsets[1:]] - counts[:, offsets[:-1]]
+    else:
+        county_counts = np.diff(offsets)[np.newaxis, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = county_sums / county_counts
+    return means.T
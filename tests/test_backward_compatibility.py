@@ -231,6 +231,18 @@ class TestAPICompatibility:
         for col in required_cols:
             assert col in gdf.columns
 
+    def test_prepare_shapefile_returns_independent_frames(self, sample_shapefile):
+        """Modifying a returned frame does not leak into later calls."""
+        processor = ModernCountyProcessor()
+
+        gdf = processor.prepare_shapefile(sample_shapefile)
+        original_ids = gdf["county_id"].tolist()
+        gdf["county_id"] = "changed"
+        gdf.drop(index=gdf.index[0], inplace=True)
+
+        again = processor.prepare_shapefile(sample_shapefile)
+        assert again["county_id"].tolist() == original_ids
+
     def test_process_zarr_data_compatibility(self, sample_shapefile, sample_zarr_data):
         """Test that process_zarr_data works as before."""
         processor = ModernCountyProcessor()
@@ -267,6 +279,35 @@ class TestAPICompatibility:
         assert isinstance(results, pd.DataFrame)
         assert len(results) > 0
 
+    def test_process_zarr_data_sees_appended_store(
+        self, sample_shapefile, sample_zarr_data
+    ):
+        """A store appended to after it was first read is reopened."""
+        with ModernCountyProcessor() as processor:
+            gdf = processor.prepare_shapefile(sample_shapefile)
+            first = processor.process_zarr_data(
+                zarr_path=sample_zarr_data, gdf=gdf, scenario="test", variable="pr"
+            )
+            assert set(first["year"]) == {2020}
+
+            # Append a second year; only subdirectories and top-level
+            # metadata change, not the store directory itself
+            with xr.open_zarr(sample_zarr_data) as ds:
+                next_year = (
+                    ds.isel(time=slice(0, 365))
+                    .assign_coords(
+                        time=pd.date_range("2021-01-01", periods=365, freq="D")
+                    )
+                    .load()
+                )
+            next_year.to_zarr(sample_zarr_data, append_dim="time")
+
+            second = processor.process_zarr_data(
+                zarr_path=sample_zarr_data, gdf=gdf, scenario="test", variable="pr"
+            )
+            assert set(second["year"]) == {2020, 2021}
+            assert len(processor._datasets) == 1
+
     def test_close_compatibility(self):
         """Test that close method works as before."""
         processor = ModernCountyProcessor()
@@ -377,6 +377,37 @@ class TestCountyProcessorIntegration:
         assert hasattr(processor, "get_processor")
         assert hasattr(processor, "close")
 
+    def test_prepare_shapefile_parquet_cache(
+        self, sample_counties_shapefile, temp_dir
+    ):
+        """Prepared shapefiles are cached as GeoParquet when a cache_dir is set."""
+        pytest.importorskip("pyarrow")
+        from climate_zarr.climate_config import ClimateConfig, get_config, set_config
+
+        cache_dir = Path(temp_dir) / "cache"
+        previous = get_config()
+        set_config(ClimateConfig(cache_dir=cache_dir))
+        try:
+            processor = ModernCountyProcessor(n_workers=1)
+            first = processor.prepare_shapefile(sample_counties_shapefile)
+            cached = list(cache_dir.glob("counties_*.parquet"))
+            assert len(cached) == 1
+
+            memoized = processor.prepare_shapefile(sample_counties_shapefile)
+            assert memoized is not first
+            assert memoized["county_id"].tolist() == first["county_id"].tolist()
+
+            # A new processor has no in-memory copy and reads the GeoParquet
+            second = ModernCountyProcessor(n_workers=1).prepare_shapefile(
+                sample_counties_shapefile
+            )
+            assert second is not first
+            assert list(second.columns) == list(first.columns)
+            assert second.crs == first.crs
+            assert second["county_id"].tolist() == first["county_id"].tolist()
+        finally:
+            set_config(previous)
+
     def test_county_processor_precipitation(
         self, sample_counties_shapefile, sample_precipitation_zarr
     ):
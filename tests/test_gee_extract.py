@@ -0,0 +1,315 @@
+"""Offline unit tests for GEE extraction retry and circuit-breaker logic.
+
+No Earth Engine calls are made, but the module imports ``ee``, so the tests
+are skipped when earthengine-api is not installed.
+"""
+
+import socket
+from http.client import RemoteDisconnected
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+ee = pytest.importorskip("ee", reason="earthengine-api not installed")
+
+from climate_zarr.gee import extract
+from climate_zarr.gee.extract import CircuitBreaker, CircuitOpenError
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Too many concurrent aggregations.",
+        "User rate limit exceeded.",
+        "Quota exceeded for quota metric 'Requests'.",
+        "Computation timed out.",
+        "Deadline exceeded.",
+        "An internal error has occurred.",
+        "Service unavailable.",
+        "Backend error.",
+    ],
+)
+def test_transient_ee_messages(message):
+    assert extract.is_transient_error(ee.EEException(message))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Image.load: Image asset 'NASA/GDDP-CMIP6/missing' not found.",
+        "Collection query aborted after accumulating over 5000 elements.",
+        "Earth Engine API has not been used in project 123 before or it is disabled.",
+        "Caller does not have required permission to use project my-project.",
+        "User memory limit exceeded.",
+    ],
+)
+def test_permanent_ee_messages(message):
+    assert not extract.is_transient_error(ee.EEException(message))
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (RemoteDisconnected("Remote end closed connection"), True),
+        (socket.timeout("timed out"), True),
+        (ConnectionResetError("Connection reset by peer"), True),
+        (ValueError("bad band name"), False),
+        (KeyError("features"), False),
+    ],
+)
+def test_connection_errors(error, transient):
+    assert extract.is_transient_error(error) is transient
+
+
+@pytest.mark.skipif(extract.HttpError is None, reason="googleapiclient not installed")
+@pytest.mark.parametrize(
+    "status, transient",
+    [
+        (429, True),
+        (500, True),
+        (502, True),
+        (503, True),
+        (504, True),
+        (400, False),
+        (403, False),
+        (404, False),
+    ],
+)
+def test_http_statuses(status, transient):
+    error = extract.HttpError(SimpleNamespace(status=status, reason="reason"), b"")
+    assert extract.is_transient_error(error) is transient
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module with a manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock seen by the extract module only."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(
+        extract,
+        "time",
+        SimpleNamespace(monotonic=fake_clock.monotonic, sleep=fake_clock.sleep),
+    )
+    return fake_clock
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock):
+    """A fresh module breaker, so tests don't share state."""
+    fresh_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+    monkeypatch.setattr(extract, "GEE_CIRCUIT_BREAKER", fresh_breaker)
+    return fresh_breaker
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self, breaker):
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.record_success()
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_closes_on_success(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.seconds_until_probe() == pytest.approx(60.0)
+
+        clock.now += 59.0
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now += 1.0
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Only one probe is in flight at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_call()
+
+    def test_half_open_probe_reopens_on_failure(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 60.0
+        breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.seconds_until_probe() == pytest.approx(60.0)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_reset_closes_circuit(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.reset()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.seconds_until_probe() == 0.0
+        breaker.before_call()
+
+
+class FailingCollection:
+    """FeatureCollection stand-in whose getInfo() always hits a transient error."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def getInfo(self):
+        self.calls += 1
+        raise ee.EEException("Too many concurrent aggregations.")
+
+
+def test_extract_stops_calling_once_circuit_opens(breaker):
+    collection = FailingCollection()
+
+    with pytest.raises(CircuitOpenError):
+        extract.extract_to_dataframe(collection, max_retries=10, jitter=0.0)
+
+    assert collection.calls == breaker.failure_threshold
+
+
+def test_skipped_batches_retried_after_cooldown(monkeypatch, breaker, clock):
+    """Batches that fail fast on an open circuit get one sequential retry."""
+    attempts = {}
+
+    def fake_batch(years, variable, **kwargs):
+        attempts[years[0]] = attempts.get(years[0], 0) + 1
+        if attempts[years[0]] == 1 and years[0] >= 2022:
+            raise CircuitOpenError("circuit open")
+        return pd.DataFrame(
+            {
+                "county_id": ["01001"] * len(years),
+                "county_name": ["Autauga"] * len(years),
+                "state": ["AL"] * len(years),
+                "year": years,
+                "scenario": ["ssp245"] * len(years),
+                "mean": [20.0] * len(years),
+            }
+        )
+
+    monkeypatch.setattr(extract, "process_variable_year_batch", fake_batch)
+    for _ in range(3):
+        breaker.record_failure()
+
+    result = extract.build_variable_dataframe(
+        variable="tas",
+        year_range=(2020, 2023),
+        model="NorESM2-LM",
+        scenario="ssp245",
+        counties=None,
+        batch_size=1,
+        max_concurrent_requests=1,
+    )
+
+    assert result["year"].tolist() == [2020, 2021, 2022, 2023]
+    assert attempts == {2020: 1, 2021: 1, 2022: 2, 2023: 2}
+    assert clock.sleeps == [pytest.approx(60.0)]
+
+
+def test_run_gee_pipeline_resets_breaker(monkeypatch):
+    """A circuit opened by an earlier run does not block the next one."""
+    from climate_zarr.gee import pipeline as gee_pipeline
+
+    shared_breaker = CircuitBreaker(failure_threshold=1)
+    shared_breaker.record_failure()
+    monkeypatch.setattr(gee_pipeline, "GEE_CIRCUIT_BREAKER", shared_breaker)
+    monkeypatch.setattr(
+        gee_pipeline, "_run_gee_pipeline_sequential", lambda config: shared_breaker.state
+    )
+
+    state = gee_pipeline.run_gee_pipeline(SimpleNamespace(use_batch_export=False))
+    assert state == CircuitBreaker.CLOSED
+
+
+class FlakySize:
+    """``collection.size()`` stand-in that fails transiently once."""
+
+    def __init__(self, count):
+        self.count = count
+        self.calls = 0
+
+    def getInfo(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise ee.EEException("Too many concurrent aggregations.")
+        return self.count
+
+
+def test_count_features_retries_transient_errors(breaker, clock):
+    size = FlakySize(3108)
+    collection = SimpleNamespace(size=lambda: size)
+
+    assert extract.count_features(collection, jitter=0.0) == 3108
+    assert size.calls == 2
+    assert clock.sleeps == [pytest.approx(5.0)]
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_sequential_pipeline_falls_back_when_count_fails(monkeypatch):
+    """A failed county count leaves the run on one year per getInfo() call."""
+    from climate_zarr.gee import pipeline as gee_pipeline
+
+    def failing_count(counties):
+        raise CircuitOpenError("circuit open")
+
+    batch_sizes = []
+
+    def fake_build(**kwargs):
+        batch_sizes.append(kwargs["batch_size"])
+        return pd.DataFrame()
+
+    monkeypatch.setattr(gee_pipeline, "initialize_gee", lambda *args, **kwargs: None)
+    monkeypatch.setattr(gee_pipeline, "get_county_features", lambda **kwargs: object())
+    monkeypatch.setattr(gee_pipeline, "count_features", failing_count)
+    monkeypatch.setattr(gee_pipeline, "build_variable_dataframe", fake_build)
+
+    config = SimpleNamespace(
+        gee=SimpleNamespace(
+            project_id=None,
+            high_volume_endpoint=False,
+            max_concurrent_requests=1,
+            county_asset="TIGER/2018/Counties",
+            batch_size=None,
+            collection_id="NASA/GDDP-CMIP6",
+            scale=27830,
+        ),
+        models=["NorESM2-LM"],
+        scenarios=["ssp245"],
+        variables=["tas"],
+        year_range=(2020, 2021),
+        region="conus",
+    )
+
+    result = gee_pipeline._run_gee_pipeline_sequential(config)
+    assert batch_sizes == [1]
+    assert result.variables_skipped == ["tas"]
@@ -0,0 +1,136 @@
+"""
+Tests for the run_pipeline orchestration: serial and parallel paths must agree.
+"""
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import pytest
+import rioxarray  # noqa: F401 - Needed for .rio accessor
+import xarray as xr
+from shapely.geometry import box
+
+from climate_zarr.pipeline import run_pipeline
+from climate_zarr.stack_nc_to_zarr import generate_hierarchical_zarr_path
+
+REGION = "hawaii"
+SCENARIO = "ssp245"
+VARIABLES = ("pr", "tas")
+
+
+def _climate_dataset(variable, seed, start="2020-01-01", periods=366):
+    """Daily grid covering the test counties."""
+    time = pd.date_range(start, periods=periods, freq="D")
+    lats = np.arange(20.0, 21.0, 0.05)
+    lons = np.arange(-157.0, -155.5, 0.05)
+    rng = np.random.default_rng(seed)
+    if variable == "pr":
+        data = rng.exponential(2e-5, size=(len(time), len(lats), len(lons)))
+        units = "kg m-2 s-1"
+    else:
+        data = 295.0 + rng.normal(0, 3, size=(len(time), len(lats), len(lons)))
+        units = "K"
+    da = xr.DataArray(
+        data,
+        coords={"time": time, "lat": lats, "lon": lons},
+        dims=["time", "lat", "lon"],
+        name=variable,
+        attrs={"units": units},
+    )
+    return da.rio.write_crs("EPSG:4326").to_dataset()
+
+
+@pytest.fixture
+def counties_shapefile(tmp_path):
+    """Three adjacent rectangular counties inside the Hawaii region."""
+    gdf = gpd.GeoDataFrame(
+        {
+            "GEOID": ["15001", "15003", "15005"],
+            "NAME": ["County A", "County B", "County C"],
+            "STUSPS": ["HI", "HI", "HI"],
+        },
+        geometry=[
+            box(-156.9 + i * 0.4, 20.1, -156.5 + i * 0.4, 20.9) for i in range(3)
+        ],
+        crs="EPSG:4326",
+    )
+    shapefile_path = tmp_path / "counties.shp"
+    gdf.to_file(shapefile_path)
+    return shapefile_path
+
+
+@pytest.fixture
+def zarr_dir(tmp_path):
+    """Hierarchical Zarr stores for each test variable."""
+    base_dir = tmp_path / "zarr"
+    for seed, variable in enumerate(VARIABLES):
+        zarr_path = generate_hierarchical_zarr_path(
+            base_dir=base_dir, variable=variable, region=REGION, scenario=SCENARIO
+        )
+        _climate_dataset(variable, seed).to_zarr(zarr_path, zarr_format=2)
+    return base_dir
+
+
+def test_parallel_stats_matches_sequential(tmp_path, counties_shapefile, zarr_dir):
+    """Per-variable worker processes produce the same merged output."""
+    results = {
+        parallel: run_pipeline(
+            shapefile=counties_shapefile,
+            region=REGION,
+            variables=VARIABLES,
+            scenario=SCENARIO,
+            zarr_dir=zarr_dir,
+            output_dir=tmp_path / f"out_{parallel}",
+            n_workers=4,
+            parallel_stats=parallel,
+        )
+        for parallel in (False, True)
+    }
+
+    sequential, parallel = results[False], results[True]
+    assert sequential.variables_processed == list(VARIABLES)
+    assert parallel.variables_processed == list(VARIABLES)
+    assert not sequential.merged_df.empty
+    pd.testing.assert_frame_equal(parallel.merged_df, sequential.merged_df)
+
+
+@pytest.fixture
+def nc_dir(tmp_path):
+    """Two yearly NetCDF files per variable under {nc_dir}/{variable}."""
+    base_dir = tmp_path / "netcdf"
+    for seed, variable in enumerate(VARIABLES):
+        variable_dir = base_dir / variable
+        variable_dir.mkdir(parents=True)
+        for offset, year in enumerate((2020, 2021)):
+            ds = _climate_dataset(
+                variable, seed * 10 + offset, start=f"{year}-01-01", periods=365
+            )
+            ds.to_netcdf(variable_dir / f"{variable}_day_{year}.nc")
+    return base_dir
+
+
+def test_parallel_conversion_matches_serial(tmp_path, counties_shapefile, nc_dir):
+    """Process-pool and single-thread conversion write the same stores."""
+    results = {
+        parallel: run_pipeline(
+            nc_dir=nc_dir,
+            shapefile=counties_shapefile,
+            region=REGION,
+            variables=VARIABLES,
+            scenario=SCENARIO,
+            zarr_dir=tmp_path / f"zarr_{parallel}",
+            output_dir=tmp_path / f"out_{parallel}",
+            parallel_conversion=parallel,
+        )
+        for parallel in (False, True)
+    }
+
+    serial, parallel = results[False], results[True]
+    for variable in VARIABLES:
+        assert parallel.zarr_paths[variable] != serial.zarr_paths[variable]
+        with xr.open_zarr(serial.zarr_paths[variable]) as serial_ds, xr.open_zarr(
+            parallel.zarr_paths[variable]
+        ) as parallel_ds:
+            assert serial_ds.sizes["time"] == 730
+            xr.testing.assert_identical(parallel_ds.load(), serial_ds.load())
+    pd.testing.assert_frame_equal(parallel.merged_df, serial.merged_df)
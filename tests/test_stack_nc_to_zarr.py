@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Tests for reduced-precision packing in NetCDF to Zarr stacking."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from climate_zarr.stack_nc_to_zarr import make_pack_encoding, stack_netcdf_to_zarr
+
+
+@pytest.fixture
+def netcdf_file(tmp_path):
+    """Write a small NetCDF file with temperature (K) and precipitation."""
+    time = pd.date_range("2020-01-01", periods=10, freq="D")
+    lats = np.arange(20.0, 20.4, 0.1)
+    lons = np.arange(-157.0, -156.5, 0.1)
+    rng = np.random.default_rng(0)
+
+    tas = (260.0 + 50.0 * rng.random((len(time), len(lats), len(lons)))).astype(
+        "float32"
+    )
+    tas[0, 0, 0] = np.nan
+    pr = (1e-4 * rng.random((len(time), len(lats), len(lons)))).astype("float32")
+
+    ds = xr.Dataset(
+        {
+            "tas": (("time", "lat", "lon"), tas, {"units": "K"}),
+            "pr": (("time", "lat", "lon"), pr, {"units": "kg m-2 s-1"}),
+        },
+        coords={"time": time, "lat": lats, "lon": lons},
+    )
+    path = tmp_path / "sample.nc"
+    ds.to_netcdf(path)
+    return path
+
+
+def _stack(netcdf_file, tmp_path, variables, **pack_kwargs):
+    """Stack a one-variable copy of the sample file and return both datasets."""
+    with xr.open_dataset(netcdf_file) as source:
+        original = source[variables].load()
+    subset_path = tmp_path / f"{'_'.join(variables)}.nc"
+    original.to_netcdf(subset_path)
+
+    zarr_path = tmp_path / "packed.zarr"
+    stack_netcdf_to_zarr([subset_path], zarr_path, show_progress=False, **pack_kwargs)
+    return original, zarr_path
+
+
+class TestPackEncoding:
+    """Test reduced-precision packing of data variables."""
+
+    @pytest.mark.parametrize(
+        "pack_dtype, scale",
+        [("int16", 0.01), ("int8", 1.0)],
+    )
+    def test_integer_temperature_round_trip(
+        self, netcdf_file, tmp_path, pack_dtype, scale
+    ):
+        """Default temperature packing stays within half a quantization step."""
+        original, zarr_path = _stack(
+            netcdf_file, tmp_path, ["tas"], pack_dtype=pack_dtype
+        )
+
+        with xr.open_zarr(zarr_path, mask_and_scale=False) as raw:
+            assert raw.tas.dtype == np.dtype(pack_dtype)
+            assert raw.tas.attrs["scale_factor"] == pytest.approx(scale)
+            assert raw.tas.attrs["add_offset"] == pytest.approx(273.15)
+            fill_value = np.iinfo(pack_dtype).min
+            assert raw.tas.attrs["_FillValue"] == fill_value
+            # NaN is stored as the reserved fill value
+            assert raw.tas.values[0, 0, 0] == fill_value
+
+        with xr.open_zarr(zarr_path) as packed:
+            decoded = packed.tas.values
+        assert np.isnan(decoded[0, 0, 0])
+        np.testing.assert_allclose(
+            decoded, original.tas.values, atol=scale / 2 + 1e-4, equal_nan=True
+        )
+
+    def test_explicit_scale_for_precipitation(self, netcdf_file, tmp_path):
+        """Precipitation packs to int16 with a caller-supplied scale."""
+        scale = 1e-8
+        original, zarr_path = _stack(
+            netcdf_file, tmp_path, ["pr"], pack_dtype="int16", pack_scale=scale
+        )
+
+        with xr.open_zarr(zarr_path, mask_and_scale=False) as raw:
+            assert raw.pr.dtype == np.int16
+            assert raw.pr.attrs["scale_factor"] == pytest.approx(scale)
+            assert raw.pr.attrs["add_offset"] == 0.0
+
+        with xr.open_zarr(zarr_path) as packed:
+            np.testing.assert_allclose(
+                packed.pr.values, original.pr.values, atol=scale / 2 + 1e-12
+            )
+
+    def test_float16_round_trip(self, netcdf_file, tmp_path):
+        """float16 keeps about three significant digits of each value."""
+        original, zarr_path = _stack(netcdf_file, tmp_path, ["tas"], pack_dtype="float16")
+
+        with xr.open_zarr(zarr_path) as packed:
+            assert packed.tas.encoding["dtype"] == np.float16
+            np.testing.assert_allclose(
+                packed.tas.values, original.tas.values, rtol=1e-3, equal_nan=True
+            )
+
+    def test_none_leaves_encoding_unchanged(self, netcdf_file):
+        with xr.open_dataset(netcdf_file) as ds:
+            assert make_pack_encoding(ds.tas, "none") == {}
+
+    @pytest.mark.parametrize(
+        "pack_dtype, pack_scale",
+        [
+            ("int32", None),
+            ("float64", None),
+            ("int16", 0.0),
+            ("int16", -0.01),
+            ("int8", float("nan")),
+            ("int16", float("inf")),
+        ],
+    )
+    def test_invalid_arguments_raise(self, netcdf_file, tmp_path, pack_dtype, pack_scale):
+        with xr.open_dataset(netcdf_file) as ds:
+            with pytest.raises(ValueError):
+                make_pack_encoding(ds.tas, pack_dtype, pack_scale)
+
+        # Rejected before any file is loaded
+        with pytest.raises(ValueError):
+            stack_netcdf_to_zarr(
+                [netcdf_file],
+                tmp_path / "invalid.zarr",
+                show_progress=False,
+                pack_dtype=pack_dtype,
+                pack_scale=pack_scale,
+            )
+        assert not (tmp_path / "invalid.zarr").exists()
+
+    @pytest.mark.parametrize("pack_dtype", ["float16", "int16"])
+    def test_precipitation_needs_scaled_integers(self, netcdf_file, tmp_path, pack_dtype):
+        """float16 is rejected for pr and integer packing needs a scale."""
+        with pytest.raises(ValueError, match="pack_scale"):
+            stack_netcdf_to_zarr(
+                [netcdf_file],
+                tmp_path / "pr.zarr",
+                show_progress=False,
+                pack_dtype=pack_dtype,
+            )
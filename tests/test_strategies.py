@@ -8,6 +8,7 @@ import geopandas as gpd
 import xarray as xr
 from shapely.geometry import Polygon
 from unittest.mock import patch
+from rioxarray.exceptions import DimensionError
 
 from climate_zarr.processors.processing_strategies import VectorizedStrategy
 
@@ -241,6 +242,51 @@ class TestVectorizedStrategy:
         assert len(results) == 0
 
 
+    @pytest.mark.parametrize(
+        "variable, data_fixture, threshold",
+        [
+            ("pr", "sample_precipitation_data", 0.1),
+            ("tas", "sample_temperature_data", 0.0),
+        ],
+    )
+    def test_cell_index_matches_clipping(
+        self, request, sample_counties, variable, data_fixture, threshold
+    ):
+        """The county cell index and per-county clipping give the same results."""
+        strategy = VectorizedStrategy()
+        data = request.getfixturevalue(data_fixture)
+        args = (data, sample_counties, variable, "test", threshold)
+
+        indexed = strategy.process(*args)
+        with patch(
+            "climate_zarr.processors.processing_strategies.build_county_cell_index",
+            side_effect=DimensionError("no spatial dimensions"),
+        ):
+            clipped = strategy.process(*args)
+
+        sort_keys = ["county_id", "year"]
+        assert len(indexed) == len(sample_counties)
+        pd.testing.assert_frame_equal(
+            indexed.sort_values(sort_keys).reset_index(drop=True),
+            clipped.sort_values(sort_keys).reset_index(drop=True),
+        )
+
+    def test_cell_index_errors_propagate(
+        self, sample_counties, sample_precipitation_data
+    ):
+        """Only unindexable grids fall back to clipping; other errors surface."""
+        strategy = VectorizedStrategy()
+
+        with patch(
+            "climate_zarr.processors.processing_strategies.build_county_cell_index",
+            side_effect=MemoryError,
+        ):
+            with pytest.raises(MemoryError):
+                strategy.process(
+                    sample_precipitation_data, sample_counties, "pr", "test", 25.4
+                )
+
+
 class TestStrategyComparison:
     """Test characteristics of the vectorized strategy."""
 
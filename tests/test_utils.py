@@ -21,6 +21,15 @@ from climate_zarr.utils.spatial_utils import (
     get_time_information,
     get_coordinate_arrays,
     clip_county_data,
+    build_county_cell_index,
+    county_spatial_means,
+)
+from climate_zarr.utils.output_utils import write_zarr
+from climate_zarr.utils.file_discovery import (
+    discover_netcdf_files,
+    read_netcdf_format,
+    read_netcdf_formats,
+    scan_directory,
 )
 
 
@@ -381,6 +390,32 @@ class TestSpatialUtils:
         assert len(clipped.y) <= len(sample_data.y)
         assert len(clipped.x) <= len(sample_data.x)
 
+    def test_clip_county_data_matches_full_grid_clip(self, sample_counties, sample_data):
+        """Cropping to the county bounds first must not change the clip."""
+        for county_geometry in sample_counties.geometry:
+            for all_touched in (True, False):
+                expected = sample_data.rio.clip(
+                    [county_geometry], all_touched=all_touched
+                )
+                clipped = clip_county_data(
+                    sample_data, county_geometry, all_touched=all_touched
+                )
+                xr.testing.assert_identical(clipped, expected)
+
+    def test_county_spatial_means_match_clip_means(self, sample_counties, sample_data):
+        """Cell-index means must equal per-county clip means."""
+        cell_index, offsets = build_county_cell_index(sample_data, sample_counties)
+        means = county_spatial_means(sample_data.values, cell_index, offsets)
+
+        assert means.shape == (len(sample_counties), len(sample_data.time))
+        for county_idx, county_geometry in enumerate(sample_counties.geometry):
+            expected = (
+                clip_county_data(sample_data, county_geometry)
+                .mean(dim=["y", "x"], skipna=True)
+                .values
+            )
+            np.testing.assert_allclose(means[county_idx], expected)
+
     def test_get_coordinate_arrays(self, sample_data):
         """Test getting coordinate arrays from data."""
         lats, lons = get_coordinate_arrays(sample_data)
@@ -447,6 +482,46 @@ class TestSpatialUtils:
         np.testing.assert_array_equal(lons_out, lons)
 
 
+class TestOutputUtils:
+    """Test output writers."""
+
+    def test_write_zarr_dataframe_round_trip(self, tmp_path):
+        """County stats tables land on (county_id, year) with Blosc-Zstd."""
+        import json
+
+        import numcodecs
+
+        results = pd.DataFrame(
+            {
+                "county_id": ["01001", "01001", "01003", "01003"],
+                "year": [2020, 2021, 2020, 2021],
+                "county_name": ["Autauga", "Autauga", "Baldwin", "Baldwin"],
+                "mean_annual_temp_c": [18.5, 18.9, 19.6, 20.1],
+                "cold_days": [12, 9, 4, 3],
+            }
+        )
+        output_path = tmp_path / "stats.zarr"
+        write_zarr(results, output_path, compression_level=5)
+
+        with xr.open_zarr(output_path) as ds:
+            assert ds["mean_annual_temp_c"].dims == ("county_id", "year")
+            assert ds["county_id"].values.tolist() == ["01001", "01003"]
+            assert ds["year"].values.tolist() == [2020, 2021]
+
+            round_trip = ds.to_dataframe().reset_index()[list(results.columns)]
+        pd.testing.assert_frame_equal(round_trip, results, check_dtype=False)
+
+        # Read the codec from the v2 array metadata, independent of zarr version
+        array_metadata = json.loads(
+            (output_path / "mean_annual_temp_c" / ".zarray").read_text()
+        )
+        compressor = array_metadata["compressor"]
+        assert compressor["id"] == "blosc"
+        assert compressor["cname"] == "zstd"
+        assert compressor["clevel"] == 5
+        assert compressor["shuffle"] == numcodecs.Blosc.BITSHUFFLE
+
+
 class TestUtilityErrorHandling:
     """Test error handling in utility functions."""
 
@@ -517,5 +592,65 @@ class TestUtilityErrorHandling:
             assert stats["dry_days"] == 0
 
 
+class TestNetCDFHeaderCheck:
+    """Test magic-byte NetCDF format detection."""
+
+    def test_read_netcdf_format(self, tmp_path):
+        """Test format detection from leading bytes."""
+        nc4 = tmp_path / "a.nc"
+        nc4.write_bytes(b"\x89HDF\r\n\x1a\n" + b"\x00" * 16)
+        nc3 = tmp_path / "b.nc"
+        nc3.write_bytes(b"CDF\x01" + b"\x00" * 16)
+        bogus = tmp_path / "c.nc"
+        bogus.write_bytes(b"not netcdf")
+
+        assert read_netcdf_format(nc4) == "netcdf4"
+        assert read_netcdf_format(nc3) == "netcdf3_classic"
+        assert read_netcdf_format(bogus) is None
+        assert read_netcdf_format(tmp_path / "missing.nc") is None
+
+    def test_read_netcdf_formats_batch(self, tmp_path):
+        """Test concurrent header reads return one entry per path."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.nc"
+            path.write_bytes(b"CDF\x02" if i % 2 else b"junk")
+            paths.append(path)
+
+        formats = read_netcdf_formats(paths)
+
+        assert list(formats) == paths
+        assert [fmt is not None for fmt in formats.values()] == [
+            False,
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert read_netcdf_formats([]) == {}
+
+    def test_discover_header_only(self, tmp_path):
+        """Test discovery validating by magic bytes only."""
+        (tmp_path / "good.nc").write_bytes(b"CDF\x01" + b"\x00" * 16)
+        (tmp_path / "bad.nc").write_bytes(b"garbage")
+        (tmp_path / "._good.nc").write_bytes(b"CDF\x01")
+
+        files = discover_netcdf_files(
+            tmp_path, validate=True, verbose=False, header_only=True
+        )
+
+        assert files == [tmp_path / "good.nc"]
+
+    def test_scan_directory_pattern(self, tmp_path):
+        """Test the single-listing scan matches like Path.glob."""
+        for name in ["tasmax_2020.nc", "tasmax_2021.nc", "pr_2020.nc", "notes.txt"]:
+            (tmp_path / name).write_bytes(b"")
+
+        assert scan_directory(tmp_path, "tasmax_*.nc") == sorted(
+            tmp_path.glob("tasmax_*.nc")
+        )
+        assert scan_directory(tmp_path) == sorted(tmp_path.glob("*.nc"))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,6 +2,7 @@
 Integration tests for NetCDF to Zarr conversion workflow.
 """
 
+import pytest
 import xarray as xr
 import numpy as np
 from pathlib import Path
@@ -157,3 +158,28 @@ class TestZarrConversionIntegration:
         # Coordinate attributes
         assert ds_zarr.lat.attrs.get("units") == ds_orig.lat.attrs.get("units")
         assert ds_zarr.lon.attrs.get("units") == ds_orig.lon.attrs.get("units")
+
+    def test_pack_dtype(self, sample_netcdf_files, zarr_output_dir):
+        """Test reduced-precision packing of data variables."""
+        output_path = zarr_output_dir / "packed_float16.zarr"
+
+        stack_netcdf_to_zarr(
+            nc_files=[Path(sample_netcdf_files[0])],
+            zarr_path=output_path,
+            pack_dtype="float16",
+        )
+
+        ds_orig = xr.open_dataset(sample_netcdf_files[0])
+        ds_zarr = xr.open_zarr(output_path)
+        assert ds_zarr.tas.encoding["dtype"] == np.float16
+        np.testing.assert_allclose(
+            ds_zarr.tas.values, ds_orig.tas.values, rtol=1e-3, equal_nan=True
+        )
+
+        # Integer packing of precipitation needs an explicit scale
+        with pytest.raises(ValueError, match="pack_scale"):
+            stack_netcdf_to_zarr(
+                nc_files=[Path(sample_netcdf_files[0])],
+                zarr_path=zarr_output_dir / "packed_int16.zarr",
+                pack_dtype="int16",
+            )